@@ -1,16 +1,52 @@
+from datetime import timedelta
+
 from django.contrib import admin
+from django.utils import timezone
 from .models import Task, TaskFeedback
 
 
+class DueDateRangeFilter(admin.SimpleListFilter):
+    """
+    Filter tasks by upcoming due date windows.
+    
+    Every option maps to plain due_date range predicates (gte/lt), so the
+    due_date index is used and no per-row date extraction is needed.
+    """
+    title = 'due date'
+    parameter_name = 'due'
+    
+    def lookups(self, request, model_admin):
+        return (
+            ('overdue', 'Overdue'),
+            ('today', 'Due today'),
+            ('week', 'Next 7 days'),
+            ('month', 'Next 30 days'),
+            ('none', 'No due date'),
+        )
+    
+    def queryset(self, request, queryset):
+        today = timezone.now().date()
+        if self.value() == 'overdue':
+            return queryset.filter(due_date__lt=today)
+        if self.value() == 'today':
+            return queryset.filter(due_date=today)
+        if self.value() == 'week':
+            return queryset.filter(due_date__gte=today, due_date__lt=today + timedelta(days=7))
+        if self.value() == 'month':
+            return queryset.filter(due_date__gte=today, due_date__lt=today + timedelta(days=30))
+        if self.value() == 'none':
+            return queryset.filter(due_date__isnull=True)
+        return queryset
+
+
 @admin.register(Task)
 class TaskAdmin(admin.ModelAdmin):
     """
     Admin interface for Task model.
     """
     list_display = ['title', 'due_date', 'estimated_hours', 'importance', 'is_overdue', 'created_at']
-    list_filter = ['due_date', 'importance', 'created_at']
+    list_filter = [DueDateRangeFilter, 'importance', 'created_at']
     search_fields = ['title']
-    date_hierarchy = 'due_date'
     filter_horizontal = ['dependencies']
     
     fieldsets = (
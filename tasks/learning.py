@@ -6,20 +6,62 @@ based on user feedback on task prioritization.
 """
 
 from typing import Dict, List, Optional
+from django.core.cache import cache
 from django.db.models import Avg, Count, Q
 from .models import TaskFeedback
 
 
+# Cached stats/weights are keyed by a per-strategy version that record_feedback bumps.
+# The version is only seen by every worker on a shared cache (REDIS_URL); with the
+# per-process fallback, the timeout bounds how stale another worker's stats can get.
+FEEDBACK_CACHE_TIMEOUT = 60
+
+
+def _feedback_version_key(strategy: str) -> str:
+    return f"feedback_version:{strategy}"
+
+
+def get_feedback_version(strategy: str) -> int:
+    """Get the current feedback version for a strategy (starts at 1)."""
+    return cache.get_or_set(_feedback_version_key(strategy), 1, None)
+
+
+def bump_feedback_version(strategy: str) -> None:
+    """Invalidate cached stats and weights for a strategy."""
+    key = _feedback_version_key(strategy)
+    cache.add(key, 1, None)
+    try:
+        cache.incr(key)
+    except ValueError:
+        # Key was evicted between add() and incr()
+        cache.set(key, 2, None)
+
+
 def get_feedback_stats(strategy: str = 'smart_balance') -> Dict:
     """
     Get statistics about user feedback for a given strategy.
     
+    Results are cached until new feedback is recorded for the strategy.
+    
     Returns:
         Dictionary with feedback statistics
     """
-    feedbacks = TaskFeedback.objects.filter(strategy=strategy)
+    key = f"feedback_stats:{strategy}:v{get_feedback_version(strategy)}"
+    return cache.get_or_set(key, lambda: _compute_feedback_stats(strategy), FEEDBACK_CACHE_TIMEOUT)
+
+
+def _compute_feedback_stats(strategy: str) -> Dict:
+    """Aggregate feedback statistics for a strategy from the database."""
+    # Single query using conditional aggregation instead of separate count/avg round trips
+    stats = TaskFeedback.objects.filter(strategy=strategy).aggregate(
+        total=Count('id'),
+        helpful_count=Count('id', filter=Q(was_helpful=True)),
+        not_helpful_count=Count('id', filter=Q(was_helpful=False)),
+        avg_helpful=Avg('priority_score', filter=Q(was_helpful=True)),
+        avg_not_helpful=Avg('priority_score', filter=Q(was_helpful=False))
+    )
     
-    total = feedbacks.count()
+    total = stats['total']
     if total == 0:
         return {
             'total': 0,
@@ -30,22 +72,15 @@ def get_feedback_stats(strategy: str = 'smart_balance') -> Dict:
             'avg_priority_score_not_helpful': 0.0
         }
     
-    helpful = feedbacks.filter(was_helpful=True)
-    not_helpful = feedbacks.filter(was_helpful=False)
-    
-    helpful_count = helpful.count()
-    not_helpful_count = not_helpful.count()
-    
-    avg_helpful_score = helpful.aggregate(avg=Avg('priority_score'))['avg'] or 0.0
-    avg_not_helpful_score = not_helpful.aggregate(avg=Avg('priority_score'))['avg'] or 0.0
+    helpful_count = stats['helpful_count']
     
     return {
         'total': total,
         'helpful_count': helpful_count,
-        'not_helpful_count': not_helpful_count,
+        'not_helpful_count': stats['not_helpful_count'],
         'helpful_rate': helpful_count / total if total > 0 else 0.0,
-        'avg_priority_score_helpful': avg_helpful_score,
-        'avg_priority_score_not_helpful': avg_not_helpful_score
+        'avg_priority_score_helpful': stats['avg_helpful'] or 0.0,
+        'avg_priority_score_not_helpful': stats['avg_not_helpful'] or 0.0
     }
 
 
@@ -63,6 +98,17 @@ def get_adjusted_weights(strategy: str = 'smart_balance', base_weights: Optional
     Returns:
         Dictionary of adjusted weights
     """
+    if base_weights is not None:
+        return _compute_adjusted_weights(strategy, base_weights)
+    
+    # Only the default weights are cached; custom base weights are cheap to
+    # adjust once the underlying stats are cached
+    key = f"feedback_weights:{strategy}:v{get_feedback_version(strategy)}"
+    return cache.get_or_set(key, lambda: _compute_adjusted_weights(strategy, None), FEEDBACK_CACHE_TIMEOUT)
+
+
+def _compute_adjusted_weights(strategy: str, base_weights: Optional[Dict]) -> Dict:
+    """Adjust base weights according to the feedback stats for a strategy."""
     if base_weights is None:
         # Default weights for smart_balance strategy
         base_weights = {
@@ -148,5 +194,27 @@ def record_feedback(
         task_attributes=task_attributes,
         feedback_note=feedback_note
     )
+    bump_feedback_version(strategy)
     return feedback
 
+
+def record_feedback_bulk(entries: List[Dict]) -> List[TaskFeedback]:
+    """
+    Record several feedback entries with a single bulk INSERT.
+    
+    Args:
+        entries: Dicts taking the same keyword arguments as record_feedback
+    
+    Returns:
+        List of created TaskFeedback instances
+    """
+    feedbacks = TaskFeedback.objects.bulk_create(
+        [TaskFeedback(**entry) for entry in entries],
+        batch_size=500
+    )
+    
+    # Invalidate cached stats once per affected strategy, not once per row
+    for strategy in {feedback.strategy for feedback in feedbacks}:
+        bump_feedback_version(strategy)
+    
+    return feedbacks
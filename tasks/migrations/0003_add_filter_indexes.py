@@ -0,0 +1,35 @@
+# Generated by Django 5.2.18 on 2026-10-14 12:11
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0002_taskfeedback'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='task',
+            name='due_date',
+            field=models.DateField(blank=True, db_index=True, help_text='Due date (YYYY-MM-DD)', null=True),
+        ),
+        migrations.AlterField(
+            model_name='taskfeedback',
+            name='created_at',
+            field=models.DateTimeField(auto_now_add=True, db_index=True),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['created_at'], name='task_created_at_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['importance'], name='task_importance_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='taskfeedback',
+            index=models.Index(fields=['strategy', 'was_helpful'], name='feedback_strategy_helpful_idx'),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-14 12:16
+
+import tasks.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0003_add_filter_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='taskfeedback',
+            name='task_attributes',
+            field=models.JSONField(default=dict, encoder=tasks.models.CompactJSONEncoder, help_text='Task attributes at time of feedback (due_date, importance, etc.)'),
+        ),
+    ]
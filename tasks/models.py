@@ -1,8 +1,24 @@
+import json
+
+import orjson
 from django.db import models
 from django.core.validators import MinValueValidator, MaxValueValidator
 from django.utils import timezone
 
 
+class CompactJSONEncoder(json.JSONEncoder):
+    """
+    orjson-backed JSON encoder for stored attributes.
+    
+    JSONField encodes through json.dumps(value, cls=encoder), which only calls
+    encode(), so overriding it moves the work into orjson's C encoder. Output
+    is compact, and as with the stdlib encoder, dates raise TypeError and
+    non-string keys are stringified.
+    """
+    def encode(self, o):
+        return orjson.dumps(o, option=orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS).decode()
+
+
 class Task(models.Model):
     """
     Task model for storing task information.
@@ -17,7 +33,7 @@ class Task(models.Model):
     - dependencies: Many-to-many relationship with other tasks
     """
     title = models.CharField(max_length=200, help_text="Task title")
-    due_date = models.DateField(null=True, blank=True, help_text="Due date (YYYY-MM-DD)")
+    due_date = models.DateField(null=True, blank=True, db_index=True, help_text="Due date (YYYY-MM-DD)")
     estimated_hours = models.FloatField(
         null=True, 
         blank=True,
@@ -43,6 +59,11 @@ class Task(models.Model):
         ordering = ['-created_at']
         verbose_name = "Task"
         verbose_name_plural = "Tasks"
+        # Columns behind the default ordering and the admin list filters
+        indexes = [
+            models.Index(fields=['created_at'], name='task_created_at_idx'),
+            models.Index(fields=['importance'], name='task_importance_idx'),
+        ]
     
     def __str__(self):
         return self.title
@@ -60,7 +81,9 @@ class Task(models.Model):
             'due_date': self.due_date.isoformat() if self.due_date else None,
             'estimated_hours': self.estimated_hours,
             'importance': self.importance,
-            'dependencies': list(self.dependencies.values_list('id', flat=True))
+            # Iterate .all() rather than values_list() so a prefetch_related('dependencies')
+            # cache on the queryset is reused instead of issuing one query per task
+            'dependencies': [dep.id for dep in self.dependencies.all()]
         }
     
     @property
@@ -78,6 +101,42 @@ class Task(models.Model):
         return None
 
 
+def tasks_for_scoring(queryset=None):
+    """
+    Load tasks as scoring dicts (the keys of Task.to_dict) in two queries.
+    
+    Reads only the scored columns via values() and fetches all dependency
+    links from the through table at once, so no model instances are built.
+    Dependency ids are in link order, not the related-task ordering that
+    to_dict follows.
+    
+    Args:
+        queryset: Optional Task queryset to restrict which tasks are loaded
+    
+    Returns:
+        list: Task dicts in the format expected by the scoring functions
+    """
+    if queryset is None:
+        queryset = Task.objects.all()
+    
+    rows = list(queryset.values('id', 'title', 'due_date', 'estimated_hours', 'importance'))
+    
+    dependencies = {row['id']: [] for row in rows}
+    # Filter on the ids already read rather than re-running the queryset, so a
+    # task committed between the two queries can't bring in unknown links
+    links = Task.dependencies.through.objects.filter(
+        from_task_id__in=list(dependencies)
+    ).values_list('from_task_id', 'to_task_id')
+    for from_id, to_id in links:
+        dependencies[from_id].append(to_id)
+    
+    for row in rows:
+        row['due_date'] = row['due_date'].isoformat() if row['due_date'] else None
+        row['dependencies'] = dependencies[row['id']]
+    
+    return rows
+
+
 class TaskFeedback(models.Model):
     """
     Model for storing user feedback on task prioritization.
@@ -93,14 +152,20 @@ class TaskFeedback(models.Model):
     feedback_note = models.TextField(blank=True, null=True, help_text="Optional feedback note")
     task_attributes = models.JSONField(
         default=dict,
+        encoder=CompactJSONEncoder,
         help_text="Task attributes at time of feedback (due_date, importance, etc.)"
     )
-    created_at = models.DateTimeField(auto_now_add=True)
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
     
     class Meta:
         ordering = ['-created_at']
         verbose_name = "Task Feedback"
         verbose_name_plural = "Task Feedbacks"
+        # Stats filter by strategy and split on was_helpful; the leading strategy
+        # column also serves strategy-only lookups
+        indexes = [
+            models.Index(fields=['strategy', 'was_helpful'], name='feedback_strategy_helpful_idx'),
+        ]
     
     def __str__(self):
         return f"Feedback for '{self.task_title}' - {'Helpful' if self.was_helpful else 'Not Helpful'}"
\ No newline at end of file
@@ -8,9 +8,26 @@ This module implements multiple scoring strategies for task prioritization:
 - Smart Balance: Balances all factors intelligently
 """
 
-from datetime import datetime, date, timedelta
-from typing import Dict, List, Optional, Tuple
-import json
+from bisect import bisect_left
+from collections import Counter
+from datetime import datetime, date
+from functools import lru_cache
+from operator import attrgetter
+from types import MappingProxyType
+from typing import Callable, Dict, List, Mapping, NamedTuple, Optional, Tuple
+import hashlib
+import heapq
+
+import orjson
+from django.core.cache import cache
+
+
+# How long analyze_tasks/get_top_tasks results are reused for identical input
+ANALYSIS_CACHE_TIMEOUT = 300
+
+# Full rankings of at least this many tasks are not cached: the result list is
+# large to pickle and keep resident, and the analyze view streams it out instead
+ANALYSIS_CACHE_MAX_TASKS = 1000
 
 
 def validate_task(task: Dict) -> Tuple[bool, Optional[str]]:
@@ -23,57 +40,162 @@ def validate_task(task: Dict) -> Tuple[bool, Optional[str]]:
     - Invalid date formats
     - Invalid importance range
     """
-    required_fields = ['title']
-    for field in required_fields:
-        if field not in task:
-            return False, f"Missing required field: {field}"
+    is_valid, error, _ = _validate_task(task)
+    return is_valid, error
+
+
+def validate_tasks(tasks: List[Dict]) -> List[Tuple[int, str]]:
+    """
+    Validate a whole task list in one pass.
+    
+    Args:
+        tasks: List of task dictionaries
+    
+    Returns:
+        (index, error_message) for each invalid task, in input order (empty if all are valid)
+    """
+    errors = []
+    for i, task in enumerate(tasks):
+        if not isinstance(task, dict):
+            errors.append((i, "Task must be an object"))
+            continue
+        is_valid, error, _ = _validate_task(task)
+        if not is_valid:
+            errors.append((i, error))
+    return errors
+
+
+class _TaskFields(NamedTuple):
+    """Scoring inputs of a validated task, with defaults filled in and numeric strings converted."""
+    importance: float
+    estimated_hours: float
+    due_date: Optional[date]
+
+
+def _validate_task(task: Dict) -> Tuple[bool, Optional[str], Optional[_TaskFields]]:
+    """
+    Validate task data and return (is_valid, error_message, fields).
+    
+    The normalized fields are handed back so scoring neither parses the due
+    date a second time nor does arithmetic on numeric strings.
+    """
+    if 'title' not in task:
+        return False, "Missing required field: title", None
+    if not isinstance(task['title'], str):
+        return False, "Title must be a string", None
+    
+    # Ids key the dependency graph, so JSON arrays/objects (unhashable) are rejected
+    if isinstance(task.get('id'), (list, dict)):
+        return False, "Task id must be a string or number", None
     
-    # Validate importance (1-10)
-    if 'importance' in task:
+    # Validate importance (1-10); plain ints from JSON skip the int() conversion
+    importance = task.get('importance', 5)
+    checked = importance
+    if type(importance) is not int:
         try:
-            importance = int(task['importance'])
-            if not (1 <= importance <= 10):
-                return False, f"Importance must be between 1 and 10, got {importance}"
+            checked = int(importance)
         except (ValueError, TypeError):
-            return False, "Importance must be an integer"
-    
-    # Validate estimated_hours
-    if 'estimated_hours' in task:
+            return False, "Importance must be an integer", None
+        # Other numbers are scored as given, but strings can't be
+        if isinstance(importance, str):
+            importance = checked
+    if not (1 <= checked <= 10):
+        return False, f"Importance must be between 1 and 10, got {checked}", None
+    
+    # Validate estimated_hours; null (a blank form field) means not provided
+    hours = task.get('estimated_hours')
+    if hours is None:
+        hours = 8
+    checked = hours
+    if type(hours) is not int and type(hours) is not float:
         try:
-            hours = float(task['estimated_hours'])
-            if hours < 0:
-                return False, "Estimated hours must be non-negative"
+            checked = float(hours)
         except (ValueError, TypeError):
-            return False, "Estimated hours must be a number"
+            return False, "Estimated hours must be a number", None
+        if isinstance(hours, str):
+            hours = checked
+    if checked < 0:
+        return False, "Estimated hours must be non-negative", None
     
     # Validate due_date
+    due_date = None
     if 'due_date' in task and task['due_date']:
         try:
             if isinstance(task['due_date'], str):
-                datetime.strptime(task['due_date'], '%Y-%m-%d')
+                due_date = _parse_iso_date(task['due_date'])
+            else:
+                due_date = parse_date(task['due_date'])
         except ValueError:
-            return False, f"Invalid date format: {task['due_date']}. Expected YYYY-MM-DD"
+            return False, f"Invalid date format: {task['due_date']}. Expected YYYY-MM-DD", None
     
     # Validate dependencies
     if 'dependencies' in task:
         if not isinstance(task['dependencies'], list):
-            return False, "Dependencies must be a list"
+            return False, "Dependencies must be a list", None
+        if any(isinstance(dep, (list, dict)) for dep in task['dependencies']):
+            return False, "Dependencies must be task ids", None
+    
+    return True, None, _TaskFields(importance, hours, due_date)
+
+
+def _task_fields(task: Dict) -> _TaskFields:
+    """
+    Get a task's scoring inputs for the per-strategy functions.
+    
+    Those score without rejecting invalid tasks, so anything validation
+    refuses is passed through as given (missing or null hours default to 8).
+    """
+    is_valid, _, fields = _validate_task(task)
+    if is_valid:
+        return fields
+    hours = task.get('estimated_hours')
+    return _TaskFields(task.get('importance', 5), 8 if hours is None else hours, parse_date(task.get('due_date')))
+
+
+@lru_cache(maxsize=4096)
+def _parse_iso_date(date_str: str) -> date:
+    """
+    Parse a YYYY-MM-DD string, raising ValueError if it is invalid.
     
-    return True, None
+    Canonical zero-padded dates take the C-implemented date.fromisoformat
+    path; anything else falls back to strptime so accepted formats are unchanged.
+    Results are memoized since task lists repeat the same few due dates
+    (date objects are immutable, so sharing them is safe).
+    """
+    if len(date_str) == 10 and date_str[4] == '-' and date_str[7] == '-':
+        return date.fromisoformat(date_str)
+    return datetime.strptime(date_str, '%Y-%m-%d').date()
 
 
 def parse_date(date_str: Optional[str]) -> Optional[date]:
-    """Parse date string to date object."""
+    """Parse date string to date object (date objects are returned as-is)."""
     if not date_str:
         return None
+    if isinstance(date_str, datetime):
+        return date_str.date()
+    if isinstance(date_str, date):
+        return date_str
     if isinstance(date_str, str):
         try:
-            return datetime.strptime(date_str, '%Y-%m-%d').date()
+            return _parse_iso_date(date_str)
         except ValueError:
             return None
     return None
 
 
+# Common US holidays as (month, day)
+# (simplified - doesn't account for variable dates like Thanksgiving)
+HOLIDAYS = (
+    (1, 1),   # New Year's Day
+    (7, 4),   # Independence Day
+    (12, 25), # Christmas
+    (12, 31), # New Year's Eve
+)
+
+# Hashed lookup for is_holiday; (month, day) pairs hold for every year, so no per-year table is needed
+_HOLIDAY_SET = frozenset(HOLIDAYS)
+
+
 def is_weekend(d: date) -> bool:
     """Check if a date is a weekend (Saturday or Sunday)."""
     return d.weekday() >= 5
@@ -86,21 +208,16 @@ def is_holiday(d: date) -> bool:
     Currently supports US holidays. In production, this could be
     configurable or use a holiday library.
     """
-    # Common US holidays (simplified - doesn't account for variable dates like Thanksgiving)
-    holidays = [
-        (1, 1),   # New Year's Day
-        (7, 4),   # Independence Day
-        (12, 25), # Christmas
-        (12, 31), # New Year's Eve
-    ]
-    
-    return (d.month, d.day) in holidays
+    return (d.month, d.day) in _HOLIDAY_SET
 
 
 def count_working_days(start_date: date, end_date: date) -> int:
     """
     Count working days (excluding weekends and holidays) between two dates.
     
+    Computed arithmetically (whole weeks plus a partial week, minus weekday
+    holidays) rather than by stepping through every day in the range.
+    
     Args:
         start_date: Start date (inclusive)
         end_date: End date (inclusive)
@@ -111,17 +228,50 @@ def count_working_days(start_date: date, end_date: date) -> int:
     if start_date > end_date:
         return 0
     
-    current = start_date
-    working_days = 0
+    full_weeks, extra_days = divmod((end_date - start_date).days + 1, 7)
+    working_days = full_weeks * 5 + _PARTIAL_WEEK_WORKING_DAYS[start_date.weekday()][extra_days]
     
-    while current <= end_date:
-        if not is_weekend(current) and not is_holiday(current):
-            working_days += 1
-        current += timedelta(days=1)
+    start_ordinal = start_date.toordinal()
+    end_ordinal = end_date.toordinal()
+    for year in range(start_date.year, end_date.year + 1):
+        for holiday_ordinal in _weekday_holiday_ordinals(year):
+            if start_ordinal <= holiday_ordinal <= end_ordinal:
+                working_days -= 1
     
     return working_days
 
 
+# _PARTIAL_WEEK_WORKING_DAYS[weekday][n]: working days among the n days starting on weekday
+_PARTIAL_WEEK_WORKING_DAYS = tuple(
+    tuple(sum(1 for offset in range(n) if (weekday + offset) % 7 < 5) for n in range(7))
+    for weekday in range(7)
+)
+
+
+@lru_cache(maxsize=None)
+def _weekday_holiday_ordinals(year: int) -> Tuple[int, ...]:
+    """Ordinals of a year's holidays that fall on weekdays (weekend holidays cost no working day)."""
+    return tuple(
+        holiday.toordinal()
+        for holiday in (date(year, month, day) for month, day in HOLIDAYS)
+        if not is_weekend(holiday)
+    )
+
+
+# Urgency for future due dates by working days remaining: a diff of at most
+# URGENCY_THRESHOLDS[i] scores URGENCY_SCORES[i]; beyond the last threshold scores 15.
+URGENCY_THRESHOLDS = (
+    0,   # Today is weekend/holiday, due date is next working day
+    1,   # Due in 1 working day
+    3,   # Due in 2-3 working days
+    5,   # Due in a week (5 working days)
+    10,  # Due in 2 weeks (10 working days)
+    20,  # Due in a month (approximately 20 working days)
+)
+URGENCY_SCORES = (95.0, 90.0, 75.0, 60.0, 45.0, 30.0, 15.0)
+
+
+@lru_cache(maxsize=4096)
 def calculate_urgency_score(due_date: Optional[date], today: date, consider_weekends: bool = True) -> float:
     """
     Calculate urgency score based on due date, considering weekends and holidays.
@@ -131,6 +281,9 @@ def calculate_urgency_score(due_date: Optional[date], today: date, consider_week
     - Far future dates get low urgency
     - If consider_weekends is True, only counts working days
     
+    Results are memoized: task lists share a handful of distinct due dates,
+    so each (due_date, today) pair only walks count_working_days once.
+    
     Returns a score between 0 and 100.
     """
     if not due_date:
@@ -157,32 +310,54 @@ def calculate_urgency_score(due_date: Optional[date], today: date, consider_week
             # Due on weekend/holiday - slightly less urgent but still high
             return 95.0
         return 100.0  # Due today (working day)
-    elif working_days_diff <= 0:
-        # Due within 0 working days (today is weekend/holiday, due date is next working day)
-        return 95.0
-    elif working_days_diff <= 1:
-        # Due in 1 working day
-        return 90.0
-    elif working_days_diff <= 3:
-        # Due in 2-3 working days
-        return 75.0
-    elif working_days_diff <= 5:
-        # Due in a week (5 working days)
-        return 60.0
-    elif working_days_diff <= 10:
-        # Due in 2 weeks (10 working days)
-        return 45.0
-    elif working_days_diff <= 20:
-        # Due in a month (approximately 20 working days)
-        return 30.0
-    else:
-        return 15.0   # Far future
+    
+    # Future: look up the working-day bucket (see URGENCY_THRESHOLDS)
+    return URGENCY_SCORES[bisect_left(URGENCY_THRESHOLDS, working_days_diff)]
+
+
+def _has_dependencies(tasks: List[Dict]) -> bool:
+    """Check whether any task declares dependencies."""
+    return any(task.get('dependencies') for task in tasks)
+
+
+def _build_graph(tasks: List[Dict]) -> Tuple[Dict, List, List[List[int]], List[List[int]]]:
+    """
+    Build index-based dependency adjacency lists for a task list.
+    
+    Returns (id_to_idx, node_ids, adj, reverse_adj) where adj[i] lists the
+    nodes task i depends on and reverse_adj[i] lists the nodes depending on i.
+    Dependencies on unknown ids are dropped and repeats are collapsed.
+    """
+    # Map task ids to dense indices so graph walks work on ints
+    id_to_idx = {}
+    node_ids = []
+    for i, task in enumerate(tasks):
+        task_id = task.get('id', i)
+        if task_id not in id_to_idx:
+            id_to_idx[task_id] = len(node_ids)
+            node_ids.append(task_id)
+    
+    adj = [[] for _ in node_ids]
+    for i, task in enumerate(tasks):
+        task_id = task.get('id', i)
+        deps = task.get('dependencies', [])
+        adj[id_to_idx[task_id]] = [id_to_idx[dep] for dep in dict.fromkeys(deps) if dep in id_to_idx]
+    
+    reverse_adj = [[] for _ in node_ids]
+    for idx, deps in enumerate(adj):
+        for dep_idx in deps:
+            reverse_adj[dep_idx].append(idx)
+    
+    return id_to_idx, node_ids, adj, reverse_adj
 
 
 def build_dependency_graph(tasks: List[Dict]) -> Dict:
     """
     Build dependency graph structure for visualization.
     
+    Args:
+        tasks: List of task dictionaries
+    
     Returns:
         {
             'nodes': [{'id': task_id, 'title': task_title, ...}],
@@ -190,7 +365,10 @@ def build_dependency_graph(tasks: List[Dict]) -> Dict:
             'circular_nodes': set of task_ids in cycles
         }
     """
-    task_ids = {task.get('id', i): i for i, task in enumerate(tasks)}
+    # Cycle detection is memoized on ids and dependencies, so a payload
+    # already checked by another endpoint costs only this id set
+    task_ids = {task.get('id', i) for i, task in enumerate(tasks)}
+    has_circular, cycle = detect_circular_dependencies(tasks)
     nodes = []
     edges = []
     
@@ -214,8 +392,6 @@ def build_dependency_graph(tasks: List[Dict]) -> Dict:
                     'to': dep
                 })
     
-    # Detect circular dependencies
-    has_circular, cycle = detect_circular_dependencies(tasks)
     circular_nodes = set(cycle) if has_circular else set()
     
     return {
@@ -230,48 +406,107 @@ def detect_circular_dependencies(tasks: List[Dict]) -> Tuple[bool, List[str]]:
     Detect circular dependencies in task list.
     
     Returns (has_circular, cycle_path).
-    Uses DFS to detect cycles.
+    Uses an iterative three-color DFS over index-based adjacency lists, so
+    long dependency chains can't hit the recursion limit. Results are
+    memoized on the (id, dependencies) pairs, since clients repeatedly send
+    the same task list to several endpoints.
     """
-    # Build dependency graph
-    task_ids = {task.get('id', i): i for i, task in enumerate(tasks)}
-    graph = {}
+    if not _has_dependencies(tasks):
+        return False, []
     
-    for i, task in enumerate(tasks):
-        task_id = task.get('id', i)
-        graph[task_id] = []
-        deps = task.get('dependencies', [])
-        for dep in deps:
-            if dep in task_ids:
-                graph[task_id].append(dep)
+    has_circular, cycle, _ = _graph_digest(tasks)
+    return has_circular, cycle
+
+
+# Dependent counts for task lists without any dependencies
+_NO_BLOCKED_COUNTS = MappingProxyType({})
+
+
+def analyze_dependencies(tasks: List[Dict]) -> Tuple[bool, List, Mapping]:
+    """
+    Check for cycles and count dependents in a single graph pass.
     
-    # DFS to detect cycles
-    visited = set()
-    rec_stack = set()
-    cycle_path = []
+    Callers that need the cycle result themselves can hand this to
+    analyze_tasks(precomputed=...) so the graph isn't examined twice.
     
-    def dfs(node, path):
-        visited.add(node)
-        rec_stack.add(node)
-        path.append(node)
-        
-        for neighbor in graph.get(node, []):
-            if neighbor not in visited:
-                if dfs(neighbor, path):
-                    return True
-            elif neighbor in rec_stack:
-                # Found cycle
-                cycle_start = path.index(neighbor)
-                cycle_path.extend(path[cycle_start:] + [neighbor])
-                return True
-        
-        rec_stack.remove(node)
-        path.pop()
-        return False
+    Returns:
+        (has_circular, cycle_path, blocked_counts), where blocked_counts is a
+        read-only mapping of task ids to how many tasks depend on them
+    """
+    if not _has_dependencies(tasks):
+        return False, [], _NO_BLOCKED_COUNTS
+    return _graph_digest(tasks)
+
+
+def _graph_digest(tasks: List[Dict]) -> Tuple[bool, List, Mapping]:
+    """
+    Run all dependency-graph work for a task list in one pass.
+    
+    Returns (has_circular, cycle_path, blocked_counts). The result depends only
+    on task ids and dependencies, so it is memoized on those; requests that
+    change other fields, or hit several endpoints, skip the graph entirely.
+    Bulk lists are not memoized, like their rankings (see ANALYSIS_CACHE_MAX_TASKS).
+    The returned blocked_counts is shared between calls, so it is read-only.
+    Ids and dependencies must be hashable, as validate_task requires.
+    """
+    if len(tasks) >= ANALYSIS_CACHE_MAX_TASKS:
+        has_circular, cycle, blocked_counts = _digest_graph(tasks)
+        return has_circular, list(cycle), blocked_counts
+    
+    # Ids are keyed with their type: 1, 1.0 and True are equal dict keys, but
+    # results echo ids back, so one request must not get another's spelling
+    fingerprint = tuple(
+        ((type(task_id), task_id), tuple(task.get('dependencies', [])))
+        for task_id, task in ((task.get('id', i), task) for i, task in enumerate(tasks))
+    )
+    has_circular, cycle, blocked_counts = _graph_digest_cached(fingerprint)
+    return has_circular, list(cycle), blocked_counts
+
+
+@lru_cache(maxsize=256)
+def _graph_digest_cached(fingerprint: Tuple) -> Tuple[bool, Tuple, Mapping]:
+    return _digest_graph([{'id': task_id, 'dependencies': deps} for (_, task_id), deps in fingerprint])
+
+
+def _digest_graph(tasks: List[Dict]) -> Tuple[bool, Tuple, Mapping]:
+    graph = _build_graph(tasks)
+    has_circular, cycle = _find_cycle(graph)
+    # Results may be memoized and shared by every caller, so nothing in them is mutable
+    return has_circular, tuple(cycle), MappingProxyType(build_blocked_counts(tasks, graph))
+
+
+def _find_cycle(graph: Tuple) -> Tuple[bool, List]:
+    """Find a cycle in a graph built by _build_graph, returning (has_circular, cycle_path)."""
+    _, node_ids, adj, _ = graph
     
-    for node in graph:
-        if node not in visited:
-            if dfs(node, []):
-                return True, cycle_path
+    # 0 = unvisited, 1 = on the current DFS path, 2 = fully explored
+    color = bytearray(len(node_ids))
+    parent = [-1] * len(node_ids)
+    
+    for root in range(len(node_ids)):
+        if color[root]:
+            continue
+        color[root] = 1
+        stack = [(root, iter(adj[root]))]
+        
+        while stack:
+            node, neighbors = stack[-1]
+            for neighbor in neighbors:
+                if color[neighbor] == 0:
+                    parent[neighbor] = node
+                    color[neighbor] = 1
+                    stack.append((neighbor, iter(adj[neighbor])))
+                    break
+                if color[neighbor] == 1:
+                    # Found cycle: walk parents back from node to neighbor
+                    cycle = [node]
+                    while cycle[-1] != neighbor:
+                        cycle.append(parent[cycle[-1]])
+                    cycle.reverse()
+                    return True, [node_ids[idx] for idx in cycle] + [node_ids[neighbor]]
+            else:
+                color[node] = 2
+                stack.pop()
     
     return False, []
 
@@ -286,7 +521,32 @@ def count_blocked_tasks(task_id: str, tasks: List[Dict]) -> int:
     return count
 
 
-def score_task_fastest_wins(task: Dict, tasks: List[Dict], today: date, consider_weekends: bool = True) -> Tuple[float, str]:
+def build_blocked_counts(tasks: List[Dict], graph: Optional[Tuple] = None) -> Dict:
+    """
+    Count how many tasks depend on each task in a single pass.
+    
+    Equivalent to calling count_blocked_tasks for every task id, but O(N + E)
+    instead of O(N^2). Returns a Counter, so unknown ids map to 0.
+    """
+    if graph is None:
+        graph = _build_graph(tasks)
+    _, node_ids, _, reverse_adj = graph
+    return Counter({node_ids[idx]: len(dependents) for idx, dependents in enumerate(reverse_adj) if dependents})
+
+
+def _task_id(task: Dict, tasks: List[Dict]):
+    """
+    Get a task's id, falling back to its position for tasks without one.
+    
+    The position lookup is O(N), so it only runs when the id is missing;
+    analyze_tasks passes positions directly instead.
+    """
+    if 'id' in task:
+        return task['id']
+    return tasks.index(task) if task in tasks else 0
+
+
+def score_task_fastest_wins(task: Dict, tasks: List[Dict], today: date, consider_weekends: bool = True, blocked_counts: Optional[Dict] = None) -> Tuple[float, str]:
     """
     Strategy: Prioritize low-effort tasks for quick wins.
     
@@ -294,9 +554,17 @@ def score_task_fastest_wins(task: Dict, tasks: List[Dict], today: date, consider
     - Low effort = high score
     - Still considers urgency and importance but weights effort heavily
     """
-    estimated_hours = task.get('estimated_hours', 8)
-    importance = task.get('importance', 5)
-    due_date = parse_date(task.get('due_date'))
+    # The id is only needed for blocked_counts, which this strategy ignores
+    fields = _task_fields(task)
+    score, factors = _score_fastest_wins(task, None, fields, tasks, today, consider_weekends, blocked_counts)
+    return score, _explain_fastest_wins(*factors)
+
+
+def _score_fastest_wins(task: Dict, task_id, fields: _TaskFields, tasks: List[Dict], today: date, consider_weekends: bool, blocked_counts: Optional[Dict]) -> Tuple[float, Tuple]:
+    """Compute the Fastest Wins score and the factors needed to explain it."""
+    estimated_hours = fields.estimated_hours
+    importance = fields.importance
+    due_date = fields.due_date
     
     # Effort score: lower hours = higher score (inverted)
     # 1 hour = 100, 8 hours = 50, 16 hours = 25
@@ -309,19 +577,22 @@ def score_task_fastest_wins(task: Dict, tasks: List[Dict], today: date, consider
     importance_score = importance * 5.0
     
     total_score = effort_score + urgency_score + importance_score
+    days_diff = (due_date - today).days if due_date else None
     
+    return total_score, (estimated_hours, days_diff)
+
+
+def _explain_fastest_wins(estimated_hours, days_diff: Optional[int]) -> str:
     explanation = f"Fastest Wins: Low effort ({estimated_hours}h) prioritized"
-    if due_date:
-        days_diff = (due_date - today).days
+    if days_diff is not None:
         if days_diff < 0:
             explanation += f", but overdue by {abs(days_diff)} days"
         elif days_diff <= 3:
             explanation += f", due in {days_diff} days"
-    
-    return total_score, explanation
+    return explanation
 
 
-def score_task_high_impact(task: Dict, tasks: List[Dict], today: date, consider_weekends: bool = True) -> Tuple[float, str]:
+def score_task_high_impact(task: Dict, tasks: List[Dict], today: date, consider_weekends: bool = True, blocked_counts: Optional[Dict] = None) -> Tuple[float, str]:
     """
     Strategy: Prioritize importance over everything else.
     
@@ -330,34 +601,46 @@ def score_task_high_impact(task: Dict, tasks: List[Dict], today: date, consider_
     - Dependencies boost score (blocking other tasks)
     - Urgency is secondary
     """
-    importance = task.get('importance', 5)
-    due_date = parse_date(task.get('due_date'))
-    task_id = task.get('id', tasks.index(task) if task in tasks else 0)
+    task_id = _task_id(task, tasks)
+    fields = _task_fields(task)
+    score, factors = _score_high_impact(task, task_id, fields, tasks, today, consider_weekends, blocked_counts)
+    return score, _explain_high_impact(*factors)
+
+
+def _score_high_impact(task: Dict, task_id, fields: _TaskFields, tasks: List[Dict], today: date, consider_weekends: bool, blocked_counts: Optional[Dict]) -> Tuple[float, Tuple]:
+    """Compute the High Impact score and the factors needed to explain it."""
+    importance = fields.importance
+    due_date = fields.due_date
     
     # Importance is the main factor (1-10 scale, multiplied by 20)
     importance_score = importance * 20.0
     
     # Dependencies boost: tasks that block others get higher priority
-    blocked_count = count_blocked_tasks(task_id, tasks)
+    if blocked_counts is not None:
+        blocked_count = blocked_counts.get(task_id, 0)
+    else:
+        blocked_count = count_blocked_tasks(task_id, tasks)
     dependency_boost = blocked_count * 15.0
     
     # Urgency matters but less
     urgency_score = calculate_urgency_score(due_date, today, consider_weekends) * 0.4
     
     total_score = importance_score + dependency_boost + urgency_score
+    days_diff = (due_date - today).days if due_date else None
     
+    return total_score, (importance, blocked_count, days_diff)
+
+
+def _explain_high_impact(importance, blocked_count: int, days_diff: Optional[int]) -> str:
     explanation = f"High Impact: Importance {importance}/10"
     if blocked_count > 0:
         explanation += f", blocks {blocked_count} other task(s)"
-    if due_date:
-        days_diff = (due_date - today).days
-        if days_diff < 0:
-            explanation += f", overdue by {abs(days_diff)} days"
-    
-    return total_score, explanation
+    if days_diff is not None and days_diff < 0:
+        explanation += f", overdue by {abs(days_diff)} days"
+    return explanation
 
 
-def score_task_deadline_driven(task: Dict, tasks: List[Dict], today: date, consider_weekends: bool = True) -> Tuple[float, str]:
+def score_task_deadline_driven(task: Dict, tasks: List[Dict], today: date, consider_weekends: bool = True, blocked_counts: Optional[Dict] = None) -> Tuple[float, str]:
     """
     Strategy: Prioritize based on due date urgency.
     
@@ -366,8 +649,16 @@ def score_task_deadline_driven(task: Dict, tasks: List[Dict], today: date, consi
     - Past due tasks get highest priority
     - No due date = low priority
     """
-    due_date = parse_date(task.get('due_date'))
-    importance = task.get('importance', 5)
+    # The id is only needed for blocked_counts, which this strategy ignores
+    fields = _task_fields(task)
+    score, factors = _score_deadline_driven(task, None, fields, tasks, today, consider_weekends, blocked_counts)
+    return score, _explain_deadline_driven(*factors)
+
+
+def _score_deadline_driven(task: Dict, task_id, fields: _TaskFields, tasks: List[Dict], today: date, consider_weekends: bool, blocked_counts: Optional[Dict]) -> Tuple[float, Tuple]:
+    """Compute the Deadline Driven score and the factors needed to explain it."""
+    importance = fields.importance
+    due_date = fields.due_date
     
     # Urgency is the main factor
     urgency_score = calculate_urgency_score(due_date, today, consider_weekends) * 2.0
@@ -376,28 +667,28 @@ def score_task_deadline_driven(task: Dict, tasks: List[Dict], today: date, consi
     importance_score = importance * 3.0
     
     # Effort: slightly prefer lower effort when urgency is similar
-    estimated_hours = task.get('estimated_hours', 8)
+    estimated_hours = fields.estimated_hours
     effort_bonus = max(0, 20.0 - estimated_hours)
     
     total_score = urgency_score + importance_score + effort_bonus
+    days_diff = (due_date - today).days if due_date else None
     
-    if due_date:
-        days_diff = (due_date - today).days
-        if days_diff < 0:
-            explanation = f"Deadline Driven: OVERDUE by {abs(days_diff)} days"
-        elif days_diff == 0:
-            explanation = "Deadline Driven: Due TODAY"
-        elif days_diff <= 3:
-            explanation = f"Deadline Driven: Due in {days_diff} days (urgent)"
-        else:
-            explanation = f"Deadline Driven: Due in {days_diff} days"
-    else:
-        explanation = "Deadline Driven: No due date (low priority)"
-    
-    return total_score, explanation
+    return total_score, (days_diff,)
 
 
-def score_task_smart_balance(task: Dict, tasks: List[Dict], today: date, consider_weekends: bool = True) -> Tuple[float, str]:
+def _explain_deadline_driven(days_diff: Optional[int]) -> str:
+    if days_diff is None:
+        return "Deadline Driven: No due date (low priority)"
+    if days_diff < 0:
+        return f"Deadline Driven: OVERDUE by {abs(days_diff)} days"
+    if days_diff == 0:
+        return "Deadline Driven: Due TODAY"
+    if days_diff <= 3:
+        return f"Deadline Driven: Due in {days_diff} days (urgent)"
+    return f"Deadline Driven: Due in {days_diff} days"
+
+
+def score_task_smart_balance(task: Dict, tasks: List[Dict], today: date, consider_weekends: bool = True, blocked_counts: Optional[Dict] = None) -> Tuple[float, str]:
     """
     Strategy: Intelligently balance all factors.
     
@@ -409,10 +700,17 @@ def score_task_smart_balance(task: Dict, tasks: List[Dict], today: date, conside
     
     The algorithm uses weighted scoring with dynamic adjustments.
     """
-    due_date = parse_date(task.get('due_date'))
-    importance = task.get('importance', 5)
-    estimated_hours = task.get('estimated_hours', 8)
-    task_id = task.get('id', tasks.index(task) if task in tasks else 0)
+    task_id = _task_id(task, tasks)
+    fields = _task_fields(task)
+    score, factors = _score_smart_balance(task, task_id, fields, tasks, today, consider_weekends, blocked_counts)
+    return score, _explain_smart_balance(*factors)
+
+
+def _score_smart_balance(task: Dict, task_id, fields: _TaskFields, tasks: List[Dict], today: date, consider_weekends: bool, blocked_counts: Optional[Dict]) -> Tuple[float, Tuple]:
+    """Compute the Smart Balance score and the factors needed to explain it."""
+    importance = fields.importance
+    due_date = fields.due_date
+    estimated_hours = fields.estimated_hours
     
     # Calculate base components
     urgency_score = calculate_urgency_score(due_date, today, consider_weekends)
@@ -422,17 +720,22 @@ def score_task_smart_balance(task: Dict, tasks: List[Dict], today: date, conside
     effort_score = max(10.0, 50.0 / (estimated_hours + 1))
     
     # Dependency boost: tasks blocking others get priority
-    blocked_count = count_blocked_tasks(task_id, tasks)
+    if blocked_counts is not None:
+        blocked_count = blocked_counts.get(task_id, 0)
+    else:
+        blocked_count = count_blocked_tasks(task_id, tasks)
     dependency_boost = blocked_count * 20.0
     
+    days_diff = (due_date - today).days if due_date else None
+    
     # Smart weighting based on context
     # If task is overdue, urgency dominates
-    if due_date and (due_date - today).days < 0:
+    if days_diff is not None and days_diff < 0:
         urgency_weight = 2.5
         importance_weight = 1.0
         effort_weight = 0.3
     # If task is due soon, balance urgency and importance
-    elif due_date and (due_date - today).days <= 3:
+    elif days_diff is not None and days_diff <= 3:
         urgency_weight = 1.5
         importance_weight = 1.2
         effort_weight = 0.5
@@ -449,10 +752,12 @@ def score_task_smart_balance(task: Dict, tasks: List[Dict], today: date, conside
         dependency_boost
     )
     
-    # Build explanation
+    return total_score, (days_diff, importance, estimated_hours, blocked_count)
+
+
+def _explain_smart_balance(days_diff: Optional[int], importance, estimated_hours, blocked_count: int) -> str:
     factors = []
-    if due_date:
-        days_diff = (due_date - today).days
+    if days_diff is not None:
         if days_diff < 0:
             factors.append(f"OVERDUE ({abs(days_diff)} days)")
         elif days_diff <= 3:
@@ -464,12 +769,35 @@ def score_task_smart_balance(task: Dict, tasks: List[Dict], today: date, conside
     if blocked_count > 0:
         factors.append(f"blocks {blocked_count} task(s)")
     
-    explanation = "Smart Balance: " + ", ".join(factors) if factors else "Smart Balance: Balanced priority"
-    
-    return total_score, explanation
+    return "Smart Balance: " + ", ".join(factors) if factors else "Smart Balance: Balanced priority"
+
+
+def _explain_invalid(error: str) -> str:
+    return f"Invalid task: {error}"
+
+
+# Strategy name -> (scorer, explainer). Scorers return (score, factors) so the
+# explanation string is only built for tasks that are actually returned.
+STRATEGIES = {
+    'fastest_wins': (_score_fastest_wins, _explain_fastest_wins),
+    'high_impact': (_score_high_impact, _explain_high_impact),
+    'deadline_driven': (_score_deadline_driven, _explain_deadline_driven),
+    'smart_balance': (_score_smart_balance, _explain_smart_balance),
+}
+
+# Scorers that look up blocked_counts by task id; the others never read it
+_SCORERS_USING_ID = frozenset({_score_high_impact, _score_smart_balance})
 
 
-def score_task(task: Dict, tasks: List[Dict], strategy: str = 'smart_balance', today: Optional[date] = None, consider_weekends: bool = True) -> Tuple[float, str]:
+def _resolve_strategy(strategy: str) -> Tuple[Callable, Callable[..., str]]:
+    """Look up (scorer, explainer) for a strategy, defaulting to smart_balance."""
+    if not isinstance(strategy, str):
+        # Unhashable values can't be looked up at all
+        return STRATEGIES['smart_balance']
+    return STRATEGIES.get(strategy, STRATEGIES['smart_balance'])
+
+
+def score_task(task: Dict, tasks: List[Dict], strategy: str = 'smart_balance', today: Optional[date] = None, consider_weekends: bool = True, blocked_counts: Optional[Dict] = None) -> Tuple[float, str]:
     """
     Main scoring function that routes to the appropriate strategy.
     
@@ -479,6 +807,7 @@ def score_task(task: Dict, tasks: List[Dict], strategy: str = 'smart_balance', t
         strategy: One of 'fastest_wins', 'high_impact', 'deadline_driven', 'smart_balance'
         today: Current date (defaults to today)
         consider_weekends: Whether to consider weekends/holidays in urgency calculation
+        blocked_counts: Precomputed result of build_blocked_counts(tasks) (computed per task if None)
     
     Returns:
         Tuple of (score, explanation)
@@ -487,25 +816,19 @@ def score_task(task: Dict, tasks: List[Dict], strategy: str = 'smart_balance', t
         today = date.today()
     
     # Validate task
-    is_valid, error = validate_task(task)
+    is_valid, error, fields = _validate_task(task)
     if not is_valid:
-        return 0.0, f"Invalid task: {error}"
+        return 0.0, _explain_invalid(error)
     
     # Route to appropriate strategy
-    strategy_map = {
-        'fastest_wins': score_task_fastest_wins,
-        'high_impact': score_task_high_impact,
-        'deadline_driven': score_task_deadline_driven,
-        'smart_balance': score_task_smart_balance,
-    }
-    
-    if strategy not in strategy_map:
-        strategy = 'smart_balance'  # Default
-    
-    return strategy_map[strategy](task, tasks, today, consider_weekends)
+    scorer, explainer = _resolve_strategy(strategy)
+    # Resolving a missing id scans tasks, so skip it for strategies that don't use one
+    task_id = _task_id(task, tasks) if scorer in _SCORERS_USING_ID else None
+    score, factors = scorer(task, task_id, fields, tasks, today, consider_weekends, blocked_counts)
+    return score, explainer(*factors)
 
 
-def analyze_tasks(tasks: List[Dict], strategy: str = 'smart_balance', consider_weekends: bool = True) -> List[Dict]:
+def analyze_tasks(tasks: List[Dict], strategy: str = 'smart_balance', consider_weekends: bool = True, precomputed: Optional[Tuple[bool, List, Mapping]] = None) -> List[Dict]:
     """
     Analyze and sort tasks by priority score.
     
@@ -513,43 +836,108 @@ def analyze_tasks(tasks: List[Dict], strategy: str = 'smart_balance', consider_w
         tasks: List of task dictionaries
         strategy: Scoring strategy to use
         consider_weekends: Whether to consider weekends/holidays in urgency calculation
+        precomputed: Result of analyze_dependencies(tasks) if the caller already has it
     
     Returns:
         List of tasks with added 'priority_score' and 'explanation' fields, sorted by score (descending)
     """
+    return _rank_tasks(tasks, strategy, consider_weekends, precomputed=precomputed)
+
+
+class _ScoredEntry(NamedTuple):
+    """Compact per-task scoring record kept until results are materialized."""
+    score: float
+    index: int
+    explain: Callable[..., str]
+    factors: Tuple
+
+
+def _analysis_cache_key(tasks: List[Dict], strategy: str, consider_weekends: bool, today: date, top_n: Optional[int]) -> str:
+    """Build a cache key from a content hash of the tasks plus every other scoring input."""
+    # Dates go through repr() rather than orjson's native encoding, so date
+    # objects stay distinct from the equivalent date strings
+    payload = orjson.dumps(
+        tasks,
+        default=repr,
+        option=orjson.OPT_SORT_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+    )
+    digest = hashlib.blake2b(payload, digest_size=16).hexdigest()
+    return f"analyze:{digest}:{strategy}:{int(consider_weekends)}:{today.isoformat()}:{top_n}"
+
+
+def _rank_tasks(tasks: List[Dict], strategy: str, consider_weekends: bool, top_n: Optional[int] = None, precomputed: Optional[Tuple[bool, List, Mapping]] = None) -> List[Dict]:
+    """
+    Score and sort tasks, reusing cached results for identical inputs.
+    
+    Results depend only on the task contents, strategy, weekend setting and
+    today's date, so they are cached under a hash of those for
+    ANALYSIS_CACHE_TIMEOUT seconds (full rankings of bulk inputs excepted).
+    """
     if not tasks:
         return []
     
-    # Check for circular dependencies
-    has_circular, cycle = detect_circular_dependencies(tasks)
-    if has_circular:
-        # Still process but warn in explanation
-        for task in tasks:
-            task_id = task.get('id', tasks.index(task))
-            if task_id in cycle:
-                task['_circular_warning'] = True
-    
+    # Scoring only tests truthiness; coerce once so e.g. "0" and False don't
+    # share a cache key, and the memoized urgency score gets a hashable flag
+    consider_weekends = bool(consider_weekends)
     today = date.today()
+    if top_n is None and len(tasks) >= ANALYSIS_CACHE_MAX_TASKS:
+        return _compute_rankings(tasks, strategy, consider_weekends, today, top_n, precomputed)
+    
+    key = _analysis_cache_key(tasks, strategy, consider_weekends, today, top_n)
+    return cache.get_or_set(
+        key,
+        lambda: _compute_rankings(tasks, strategy, consider_weekends, today, top_n, precomputed),
+        ANALYSIS_CACHE_TIMEOUT
+    )
+
+
+def _compute_rankings(tasks: List[Dict], strategy: str, consider_weekends: bool, today: date, top_n: Optional[int], precomputed: Optional[Tuple[bool, List, Mapping]] = None) -> List[Dict]:
+    """
+    Score and sort tasks, materializing output dicts only for the first top_n.
     
-    # Score all tasks
-    scored_tasks = []
-    for task in tasks:
-        score, explanation = score_task(task, tasks, strategy, today, consider_weekends)
-        task_copy = task.copy()
-        task_copy['priority_score'] = round(score, 2)
-        task_copy['explanation'] = explanation
-        
-        # Add circular dependency warning if applicable
-        if task_copy.get('_circular_warning'):
-            task_copy['explanation'] += " [WARNING: Part of circular dependency]"
-            del task_copy['_circular_warning']
+    Explanations and task copies are built after sorting, so callers that only
+    need a few results don't pay for formatting every task.
+    """
+    # One (memoized) graph pass yields the cycle check and dependent counts,
+    # unless the caller already ran it
+    has_circular, cycle, blocked_counts = precomputed if precomputed is not None else analyze_dependencies(tasks)
+    circular_ids = set(cycle) if has_circular else set()
+    
+    # Resolve the strategy once rather than per task
+    scorer, explainer = _resolve_strategy(strategy)
+    
+    # Score all tasks, deferring explanation formatting
+    scored = []
+    for i, task in enumerate(tasks):
+        is_valid, error, fields = _validate_task(task)
+        if not is_valid:
+            scored.append(_ScoredEntry(0.0, i, _explain_invalid, (error,)))
+            continue
         
-        scored_tasks.append(task_copy)
+        # Tasks without an id are identified by position, as in detect_circular_dependencies
+        score, factors = scorer(task, task.get('id', i), fields, tasks, today, consider_weekends, blocked_counts)
+        scored.append(_ScoredEntry(round(score, 2), i, explainer, factors))
+    
+    # Sort by score (descending); both paths are stable, so ties keep input order
+    if top_n is not None:
+        # Partial selection is O(N log top_n), cheaper than a full sort for /suggest
+        scored = heapq.nlargest(top_n, scored, key=attrgetter('score'))
+    else:
+        scored.sort(key=attrgetter('score'), reverse=True)
     
-    # Sort by score (descending)
-    scored_tasks.sort(key=lambda x: x['priority_score'], reverse=True)
+    results = []
+    for entry in scored:
+        task = tasks[entry.index]
+        explanation = entry.explain(*entry.factors)
+        
+        # Still process but warn in explanation
+        if task.get('id', entry.index) in circular_ids:
+            explanation += " [WARNING: Part of circular dependency]"
+        
+        # Build the output dict in one step rather than copying and then growing it
+        results.append({**task, 'priority_score': entry.score, 'explanation': explanation})
     
-    return scored_tasks
+    return results
 
 
 def get_top_tasks(tasks: List[Dict], strategy: str = 'smart_balance', top_n: int = 3, consider_weekends: bool = True) -> List[Dict]:
@@ -565,6 +953,4 @@ def get_top_tasks(tasks: List[Dict], strategy: str = 'smart_balance', top_n: int
     Returns:
         List of top N tasks with priority scores and explanations
     """
-    analyzed = analyze_tasks(tasks, strategy, consider_weekends)
-    return analyzed[:top_n]
-
+    return _rank_tasks(tasks, strategy, consider_weekends, top_n)
@@ -10,23 +10,39 @@ Tests cover:
 - Task validation
 """
 
-from django.test import TestCase
+import gzip
+import json
+from unittest import mock
+
+from django.contrib.admin.sites import AdminSite
+from django.core.cache import cache
+from django.test import RequestFactory, TestCase, override_settings
+from django.utils import timezone
 from datetime import date, timedelta
 from .scoring import (
     validate_task,
+    validate_tasks,
     calculate_urgency_score,
     detect_circular_dependencies,
     count_blocked_tasks,
+    build_blocked_counts,
     score_task_fastest_wins,
     score_task_high_impact,
     score_task_deadline_driven,
     score_task_smart_balance,
     score_task,
     analyze_tasks,
+    analyze_dependencies,
+    get_top_tasks,
+    parse_date,
     is_weekend,
     is_holiday,
     count_working_days
 )
+from . import views
+from .admin import DueDateRangeFilter, TaskAdmin
+from .models import CompactJSONEncoder, Task, TaskFeedback, tasks_for_scoring
+from .learning import get_adjusted_weights, get_feedback_stats, record_feedback, record_feedback_bulk
 
 
 class TaskValidationTests(TestCase):
@@ -101,6 +117,72 @@ class TaskValidationTests(TestCase):
         }
         is_valid, error = validate_task(task)
         self.assertFalse(is_valid)
+    
+    def test_unhashable_ids_rejected(self):
+        """Test ids and dependencies the dependency graph can't key are rejected."""
+        for task in (
+            {'id': [1], 'title': 'List id'},
+            {'id': 1, 'title': 'List dependency', 'dependencies': [[2]]},
+            {'id': 1, 'title': 'Null dependencies', 'dependencies': None},
+        ):
+            is_valid, error = validate_task(task)
+            self.assertFalse(is_valid)
+            self.assertIsNotNone(error)
+    
+    def test_string_fields_are_coerced(self):
+        """Test numeric strings are accepted for importance and hours and scored as numbers."""
+        task = {'title': 'Test', 'importance': '7', 'estimated_hours': '2.5'}
+        is_valid, error = validate_task(task)
+        self.assertTrue(is_valid)
+        
+        numeric = {'title': 'Test', 'importance': 7, 'estimated_hours': 2.5}
+        for strategy in ('fastest_wins', 'high_impact', 'deadline_driven', 'smart_balance'):
+            self.assertEqual(score_task(task, [task], strategy), score_task(numeric, [numeric], strategy))
+    
+    def test_non_string_title_rejected(self):
+        """Test titles must be strings."""
+        is_valid, error = validate_task({'title': 1})
+        self.assertFalse(is_valid)
+        self.assertIn('title', error.lower())
+        
+        is_valid, error = validate_task({'title': 'Test', 'estimated_hours': 'lots'})
+        self.assertFalse(is_valid)
+        self.assertIn('hours', error.lower())
+    
+    def test_validate_tasks_reports_indexes(self):
+        """Test batch validation reports each invalid task by position."""
+        tasks = [
+            {'title': 'Valid'},
+            {'importance': 5},
+            {'title': 'Bad importance', 'importance': 11},
+            'not-a-task'
+        ]
+        errors = validate_tasks(tasks)
+        self.assertEqual([index for index, _ in errors], [1, 2, 3])
+        self.assertIn('title', errors[0][1].lower())
+        self.assertEqual(validate_tasks(tasks[:1]), [])
+
+
+class ParseDateTests(TestCase):
+    """Test due date parsing."""
+    
+    def test_parse_iso_string(self):
+        """Test parsing a YYYY-MM-DD string."""
+        self.assertEqual(parse_date('2025-12-01'), date(2025, 12, 1))
+    
+    def test_parse_unpadded_string(self):
+        """Test non zero-padded dates are still accepted."""
+        self.assertEqual(parse_date('2025-1-5'), date(2025, 1, 5))
+    
+    def test_parse_invalid_string(self):
+        """Test invalid dates parse to None."""
+        self.assertIsNone(parse_date('2025-13-01'))
+        self.assertIsNone(parse_date('invalid-date'))
+        self.assertIsNone(parse_date(None))
+    
+    def test_parse_date_object(self):
+        """Test date objects are returned unchanged."""
+        self.assertEqual(parse_date(date(2025, 12, 1)), date(2025, 12, 1))
 
 
 class UrgencyScoreTests(TestCase):
@@ -215,6 +297,19 @@ class WeekendHolidayTests(TestCase):
         # Should exclude weekends (Sat, Sun)
         self.assertGreater(working_days, 0)
         self.assertLess(working_days, (end - start).days + 1)
+    
+    def test_count_working_days_exact(self):
+        """Test working day counts across weekends, holidays and long ranges."""
+        # Fri Nov 28 -> Fri Dec 5: 8 calendar days spanning one weekend
+        self.assertEqual(count_working_days(date(2025, 11, 28), date(2025, 12, 5)), 6)
+        # Christmas (Thu) and New Year's Eve (Wed) both fall on weekdays
+        self.assertEqual(count_working_days(date(2025, 12, 22), date(2025, 12, 31)), 6)
+        # Same day and reversed ranges
+        self.assertEqual(count_working_days(date(2025, 12, 1), date(2025, 12, 1)), 1)
+        self.assertEqual(count_working_days(date(2025, 12, 5), date(2025, 12, 1)), 0)
+        # Full year 2026: 261 weekdays, of which Jan 1, Dec 25 and Dec 31 are holidays
+        # (Jul 4 is a Saturday)
+        self.assertEqual(count_working_days(date(2026, 1, 1), date(2026, 12, 31)), 258)
 
 
 class CircularDependencyTests(TestCase):
@@ -260,6 +355,55 @@ class CircularDependencyTests(TestCase):
         ]
         has_circular, cycle = detect_circular_dependencies(tasks)
         self.assertFalse(has_circular)
+    
+    def test_cycle_path_is_closed(self):
+        """Test the returned cycle path starts and ends on the same task."""
+        tasks = [
+            {'id': 1, 'dependencies': [2]},
+            {'id': 2, 'dependencies': [3]},
+            {'id': 3, 'dependencies': [2]}
+        ]
+        has_circular, cycle = detect_circular_dependencies(tasks)
+        self.assertTrue(has_circular)
+        self.assertEqual(cycle, [2, 3, 2])
+    
+    def test_memoized_result_is_not_shared(self):
+        """Test repeated detection returns equal but independent cycle lists."""
+        tasks = [
+            {'id': 1, 'dependencies': [2]},
+            {'id': 2, 'dependencies': [1]}
+        ]
+        _, first = detect_circular_dependencies(tasks)
+        first.append('mutated')
+        _, second = detect_circular_dependencies([dict(task) for task in tasks])
+        self.assertEqual(second, [1, 2, 1])
+    
+    def test_memoized_result_keeps_id_types(self):
+        """Test equal ids of different types don't share a memoized result."""
+        float_ids = [{'id': 1.0, 'dependencies': [2]}, {'id': 2, 'dependencies': [1.0]}]
+        bool_ids = [{'id': True, 'dependencies': [2]}, {'id': 2, 'dependencies': [True]}]
+        self.assertEqual(detect_circular_dependencies(float_ids)[1], [1.0, 2, 1.0])
+        
+        cycle = detect_circular_dependencies(bool_ids)[1]
+        self.assertEqual([type(task_id) for task_id in cycle], [bool, int, bool])
+    
+    def test_bulk_graphs_not_memoized(self):
+        """Test bulk task lists skip the graph memo."""
+        tasks = [{'id': 1, 'dependencies': [2]}, {'id': 2, 'dependencies': []}]
+        with mock.patch('tasks.scoring.ANALYSIS_CACHE_MAX_TASKS', 2), mock.patch('tasks.scoring._graph_digest_cached') as cached:
+            self.assertEqual(analyze_dependencies(tasks)[2][2], 1)
+            cached.assert_not_called()
+    
+    def test_long_dependency_chain(self):
+        """Test detection doesn't hit the recursion limit on long chains."""
+        tasks = [{'id': i, 'dependencies': [i + 1]} for i in range(5000)]
+        has_circular, cycle = detect_circular_dependencies(tasks)
+        self.assertFalse(has_circular)
+        
+        tasks[-1]['dependencies'] = [0]
+        has_circular, cycle = detect_circular_dependencies(tasks)
+        self.assertTrue(has_circular)
+        self.assertEqual(len(cycle), 5001)
 
 
 class BlockedTasksTests(TestCase):
@@ -284,6 +428,18 @@ class BlockedTasksTests(TestCase):
         ]
         count = count_blocked_tasks(1, tasks)
         self.assertEqual(count, 0)
+    
+    def test_build_blocked_counts_matches_per_task_count(self):
+        """Test the single-pass index agrees with count_blocked_tasks."""
+        tasks = [
+            {'id': 1, 'dependencies': []},
+            {'id': 2, 'dependencies': [1, 1]},
+            {'id': 3, 'dependencies': [1, 2]},
+            {'id': 4, 'dependencies': [2, 99]}
+        ]
+        blocked = build_blocked_counts(tasks)
+        for task in tasks:
+            self.assertEqual(blocked[task['id']], count_blocked_tasks(task['id'], tasks))
 
 
 class ScoringStrategyTests(TestCase):
@@ -378,6 +534,17 @@ class ScoringStrategyTests(TestCase):
         self.assertGreater(score3, 0)
         self.assertGreater(score4, 0)
     
+    def test_id_only_resolved_when_used(self):
+        """Test strategies that ignore blocked counts skip the task id lookup."""
+        task = {'title': 'No id', 'estimated_hours': 2}
+        
+        with mock.patch('tasks.scoring._task_id') as task_id:
+            score_task_fastest_wins(task, [task], self.today)
+            score_task_deadline_driven(task, [task], self.today)
+            score_task(task, [task], 'fastest_wins', self.today)
+            score_task(task, [task], 'deadline_driven', self.today)
+            task_id.assert_not_called()
+    
     def test_invalid_strategy_defaults(self):
         """Test that invalid strategy defaults to smart_balance."""
         task = self.tasks[0]
@@ -412,6 +579,92 @@ class AnalyzeTasksTests(TestCase):
             }
         ]
     
+    def test_get_top_tasks_matches_full_ranking(self):
+        """Test top-N selection matches the head of the full ranking, ties included."""
+        tasks = [{'id': i, 'title': f'Task {i}', 'importance': i % 3 + 1} for i in range(1, 11)]
+        
+        for top_n in (1, 3, 10, 20):
+            self.assertEqual(get_top_tasks(tasks, 'high_impact', top_n=top_n), analyze_tasks(tasks, 'high_impact')[:top_n])
+    
+    def test_graph_work_reused_when_only_fields_change(self):
+        """Test changing non-dependency fields reuses the memoized graph pass."""
+        first = analyze_tasks(self.tasks, 'high_impact')
+        changed = [dict(task) for task in self.tasks]
+        changed[0]['importance'] = 2
+        
+        with mock.patch('tasks.scoring._build_graph') as build_graph:
+            result = analyze_tasks(changed, 'high_impact')
+            build_graph.assert_not_called()
+        self.assertIn('blocks 1 other task(s)', next(t for t in result if t['id'] == 1)['explanation'])
+        self.assertNotEqual(first, result)
+    
+    def test_analyze_tasks_uses_precomputed_dependencies(self):
+        """Test analyze_tasks reuses a caller's analyze_dependencies result."""
+        cache.clear()
+        dependencies = analyze_dependencies(self.tasks)
+        self.assertEqual(dependencies[:2], (False, []))
+        self.assertEqual(dependencies[2][1], 1)
+        
+        with mock.patch('tasks.scoring._graph_digest') as digest:
+            result = analyze_tasks(self.tasks, 'high_impact', precomputed=dependencies)
+            digest.assert_not_called()
+        self.assertIn('blocks 1 other task(s)', next(t for t in result if t['id'] == 1)['explanation'])
+    
+    def test_analyze_dependencies_counts_are_read_only(self):
+        """Test memoized dependent counts can't be changed through the public result."""
+        cache.clear()
+        _, _, blocked_counts = analyze_dependencies(self.tasks)
+        with self.assertRaises(TypeError):
+            blocked_counts[1] += 10
+        
+        result = analyze_tasks(self.tasks, 'high_impact')
+        self.assertIn('blocks 1 other task(s)', next(t for t in result if t['id'] == 1)['explanation'])
+        self.assertEqual(analyze_dependencies([{'id': 1, 'title': 'Alone'}])[2].get(1, 0), 0)
+    
+    def test_analyze_tasks_cached_for_identical_input(self):
+        """Test repeat analysis of identical tasks reuses the cached result."""
+        cache.clear()
+        first = analyze_tasks(self.tasks, 'smart_balance')
+        
+        with mock.patch('tasks.scoring._compute_rankings') as compute:
+            second = analyze_tasks([dict(task) for task in self.tasks], 'smart_balance')
+            compute.assert_not_called()
+        self.assertEqual(first, second)
+        
+        # Any change to the input is a cache miss
+        changed = [dict(task) for task in self.tasks]
+        changed[1]['importance'] = 10
+        result = analyze_tasks(changed, 'smart_balance')
+        scores = {task['id']: task['priority_score'] for task in result}
+        original_scores = {task['id']: task['priority_score'] for task in first}
+        self.assertGreater(scores[2], original_scores[2])
+    
+    def test_bulk_rankings_not_cached(self):
+        """Test full rankings of bulk inputs are recomputed rather than cached."""
+        cache.clear()
+        with mock.patch('tasks.scoring.ANALYSIS_CACHE_MAX_TASKS', 2):
+            analyze_tasks(self.tasks, 'smart_balance')
+            with mock.patch('tasks.scoring._compute_rankings', return_value=[]) as compute:
+                analyze_tasks(self.tasks, 'smart_balance')
+            compute.assert_called_once()
+            
+            # Top-N selections stay small, so they are still cached
+            get_top_tasks(self.tasks, 'smart_balance', top_n=1)
+            with mock.patch('tasks.scoring._compute_rankings') as compute:
+                get_top_tasks(self.tasks, 'smart_balance', top_n=1)
+            compute.assert_not_called()
+    
+    def test_consider_weekends_coerced(self):
+        """Test non-boolean consider_weekends values score and cache by truthiness."""
+        for value, expected in (('0', True), ('false', True), (None, False), ([], False), ([1], True)):
+            cache.clear()
+            analyze_tasks(self.tasks, 'deadline_driven', not expected)
+            
+            # The other flag's cached result is not reused, and scoring sees a bool
+            with mock.patch('tasks.scoring._compute_rankings', return_value=[]) as compute:
+                analyze_tasks(self.tasks, 'deadline_driven', value)
+            self.assertIs(compute.call_args.args[2], expected)
+    
     def test_analyze_tasks_empty_list(self):
         """Test analyzing empty task list."""
         result = analyze_tasks([])
@@ -542,3 +795,550 @@ class EdgeCaseTests(TestCase):
         self.assertIn('block', explanation.lower())
         self.assertIsInstance(score, float)
         self.assertGreater(score, 0)
+
+
+class AnalyzeViewTests(TestCase):
+    """Test the analyze and suggest API endpoints."""
+    
+    def setUp(self):
+        """Set up test data."""
+        cache.clear()
+        self.tasks = [
+            {'id': 1, 'title': 'Task 1', 'due_date': '2025-12-01', 'estimated_hours': 3, 'importance': 8, 'dependencies': []},
+            {'id': 2, 'title': 'Task 2', 'due_date': '2025-12-15', 'estimated_hours': 5, 'importance': 6, 'dependencies': [1]}
+        ]
+    
+    def post_json(self, url, data):
+        """POST a JSON body to url."""
+        return self.client.post(url, json.dumps(data), content_type='application/json')
+    
+    def test_analyze_returns_json(self):
+        """Test analyze endpoint returns scored tasks as JSON."""
+        response = self.post_json('/api/tasks/analyze/', {'tasks': self.tasks})
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'application/json')
+        data = response.json()
+        self.assertEqual(data['count'], 2)
+        self.assertEqual(data['strategy'], 'smart_balance')
+        self.assertEqual(data['tasks'], analyze_tasks(self.tasks))
+    
+    def test_analyze_caches_identical_requests(self):
+        """Test a repeated analyze request is served from the response cache."""
+        first = self.post_json('/api/tasks/analyze/', {'tasks': self.tasks})
+        
+        with mock.patch('tasks.views.analyze_tasks') as analyze:
+            second = self.post_json('/api/tasks/analyze/', {'tasks': self.tasks})
+            analyze.assert_not_called()
+        self.assertEqual(first.content, second.content)
+        
+        # Rejected payloads are not cached
+        bad = {'tasks': [{'importance': 5}]}
+        self.assertEqual(self.post_json('/api/tasks/analyze/', bad).status_code, 400)
+        self.assertEqual(self.post_json('/api/tasks/analyze/', bad).status_code, 400)
+    
+    def test_analyze_streams_large_results(self):
+        """Test large analyses are streamed as the same JSON document."""
+        tasks = [{'id': i, 'title': f'Task {i}', 'importance': i % 10 + 1, 'dependencies': [i - 1] if i else []} for i in range(7)]
+        tasks[0]['dependencies'] = [6]
+        expected = self.post_json('/api/tasks/analyze/', {'tasks': tasks}).json()
+        cache.clear()
+        
+        with mock.patch('tasks.views.STREAM_MIN_TASKS', 5), mock.patch('tasks.views.STREAM_CHUNK_TASKS', 3):
+            response = self.post_json('/api/tasks/analyze/', {'tasks': tasks})
+        
+        self.assertTrue(response.streaming)
+        self.assertEqual(json.loads(b''.join(response.streaming_content)), expected)
+        self.assertIn('warning', expected)
+    
+    def test_empty_task_lists(self):
+        """Test empty task lists return empty results without scoring."""
+        with mock.patch('tasks.views.analyze_tasks') as analyze:
+            response = self.post_json('/api/tasks/analyze/', {'tasks': [], 'strategy': 'fastest_wins'})
+            analyze.assert_not_called()
+        self.assertEqual(response.json(), {'tasks': [], 'strategy': 'fastest_wins', 'count': 0})
+        
+        response = self.post_json('/api/tasks/dependency-graph/', {'tasks': []})
+        self.assertEqual(response.json(), {
+            'graph': {'nodes': [], 'edges': [], 'circular_nodes': []},
+            'has_circular': False,
+            'cycle': []
+        })
+    
+    @override_settings(ANALYZE_SINGLEFLIGHT=True)
+    def test_analyze_waits_for_inflight_identical_request(self):
+        """Test an identical request in flight is awaited instead of recomputed."""
+        body = json.dumps({'tasks': self.tasks})
+        cache_key = views._response_cache_key('analyze', RequestFactory().post('/api/tasks/analyze/', body, content_type='application/json'))
+        content = self.client.post('/api/tasks/analyze/', body, content_type='application/json').content
+        cache.clear()
+        
+        # Another request holds the lock and publishes its result while we wait
+        cache.add(f"{cache_key}:lock", 1)
+        with mock.patch('tasks.views.time.sleep', side_effect=lambda _: cache.set(cache_key, content)), mock.patch('tasks.views.analyze_tasks') as analyze:
+            response = self.client.post('/api/tasks/analyze/', body, content_type='application/json')
+            analyze.assert_not_called()
+        self.assertEqual(response.content, content)
+    
+    @override_settings(ANALYZE_SINGLEFLIGHT=True)
+    def test_analyze_computes_when_inflight_request_fails(self):
+        """Test waiters compute themselves once the lock is released without a result."""
+        body = json.dumps({'tasks': self.tasks})
+        cache_key = views._response_cache_key('analyze', RequestFactory().post('/api/tasks/analyze/', body, content_type='application/json'))
+        cache.add(f"{cache_key}:lock", 1)
+        
+        with mock.patch('tasks.views.time.sleep', side_effect=lambda _: cache.delete(f"{cache_key}:lock")) as sleep:
+            response = self.client.post('/api/tasks/analyze/', body, content_type='application/json')
+        self.assertEqual(sleep.call_count, 1)
+        self.assertEqual(response.status_code, 200)
+        self.assertIsNone(cache.get(f"{cache_key}:lock"))
+    
+    @override_settings(ANALYZE_SINGLEFLIGHT=False)
+    def test_analyze_skips_lock_without_shared_cache(self):
+        """Test no singleflight lock is taken unless the cache is shared."""
+        with mock.patch('tasks.views._singleflight') as singleflight:
+            response = self.post_json('/api/tasks/analyze/', {'tasks': self.tasks})
+            singleflight.assert_not_called()
+        self.assertEqual(response.status_code, 200)
+    
+    @override_settings(ANALYZE_SINGLEFLIGHT=True)
+    def test_analyze_skips_lock_for_streamed_results(self):
+        """Test bulk requests, whose streamed results aren't cached, take no singleflight lock."""
+        with mock.patch('tasks.views.STREAM_MIN_TASKS', 2), mock.patch('tasks.views._singleflight') as singleflight:
+            response = self.post_json('/api/tasks/analyze/', {'tasks': self.tasks})
+            singleflight.assert_not_called()
+        self.assertTrue(response.streaming)
+    
+    def test_analyze_response_compressed(self):
+        """Test analyze responses are gzipped for clients that accept it."""
+        tasks = [{'id': i, 'title': f'Task {i}', 'importance': i % 10 + 1} for i in range(20)]
+        response = self.client.post(
+            '/api/tasks/analyze/', json.dumps({'tasks': tasks}),
+            content_type='application/json', HTTP_ACCEPT_ENCODING='gzip'
+        )
+        
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertEqual(json.loads(gzip.decompress(response.content))['count'], 20)
+    
+    def test_consider_weekends_null(self):
+        """Test non-boolean consider_weekends values are accepted by the scoring endpoints."""
+        for url in ('/api/tasks/analyze/', '/api/tasks/suggest/'):
+            for value in (None, 'false', [1]):
+                response = self.post_json(url, {'tasks': self.tasks, 'consider_weekends': value})
+                self.assertEqual(response.status_code, 200)
+    
+    def test_analyze_form_payload(self):
+        """Test tasks shaped like the frontend form's, with blank optional fields, are ranked."""
+        tasks = [
+            {'id': 1, 'title': 'Blank fields', 'due_date': None, 'estimated_hours': None, 'importance': 5, 'dependencies': []},
+            {'id': 2, 'title': 'Filled in', 'due_date': '2025-12-01', 'estimated_hours': 2.5, 'importance': 8, 'dependencies': [1]}
+        ]
+        for strategy in ('smart_balance', 'fastest_wins', 'high_impact', 'deadline_driven'):
+            response = self.post_json('/api/tasks/analyze/', {'tasks': tasks, 'strategy': strategy})
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.json()['count'], 2)
+        
+        # A blank estimate scores like a missing one
+        missing = dict(tasks[0])
+        del missing['estimated_hours']
+        self.assertEqual(
+            score_task(tasks[0], tasks, 'fastest_wins', date(2025, 11, 1)),
+            score_task(missing, tasks, 'fastest_wins', date(2025, 11, 1))
+        )
+    
+    def test_analyze_invalid_json(self):
+        """Test analyze endpoint rejects malformed JSON."""
+        response = self.client.post('/api/tasks/analyze/', '{not json', content_type='application/json')
+        
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()['error'], 'Invalid JSON in request body')
+    
+    def test_analyze_rejects_invalid_task(self):
+        """Test analyze endpoint reports the index of the first invalid task."""
+        tasks = self.tasks + [{'id': 3, 'title': 'Bad', 'importance': 42}]
+        
+        with mock.patch('tasks.views.analyze_tasks') as analyze:
+            response = self.post_json('/api/tasks/analyze/', {'tasks': tasks})
+            analyze.assert_not_called()
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()['index'], 2)
+        self.assertIn('importance', response.json()['error'].lower())
+    
+    def test_analyze_rejects_duplicate_ids(self):
+        """Test analyze endpoint rejects tasks sharing an id."""
+        tasks = self.tasks + [{'id': 1, 'title': 'Duplicate'}]
+        response = self.post_json('/api/tasks/analyze/', {'tasks': tasks})
+        
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()['index'], 2)
+        
+        # Tasks without an id take their position, which can collide too
+        response = self.post_json('/api/tasks/analyze/', {'tasks': [{'title': 'a'}, {'id': 0, 'title': 'b'}]})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()['index'], 1)
+    
+    def test_suggest_and_graph_reject_invalid_tasks(self):
+        """Test suggest and dependency-graph endpoints reject malformed tasks with a 400."""
+        for url in ('/api/tasks/suggest/', '/api/tasks/dependency-graph/'):
+            for tasks, index in (([1], 0), (self.tasks + [{'id': [3], 'title': 'List id'}], 2), (self.tasks + [{'id': 2, 'title': 'Duplicate'}], 2)):
+                response = self.post_json(url, {'tasks': tasks})
+                self.assertEqual(response.status_code, 400)
+                self.assertEqual(response.json()['index'], index)
+        
+        response = self.client.get('/api/tasks/suggest/', {'tasks': json.dumps([1])})
+        self.assertEqual(response.status_code, 400)
+    
+    def test_endpoints_accept_numeric_strings(self):
+        """Test numeric string fields are scored rather than crashing any endpoint."""
+        tasks = [{'id': 1, 'title': 'Strings', 'importance': '5', 'estimated_hours': '3', 'dependencies': []}]
+        for url in ('/api/tasks/analyze/', '/api/tasks/suggest/', '/api/tasks/dependency-graph/'):
+            for strategy in ('smart_balance', 'fastest_wins', 'high_impact', 'deadline_driven'):
+                response = self.post_json(url, {'tasks': tasks, 'strategy': strategy})
+                self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.post_json('/api/tasks/analyze/', {'tasks': tasks}).json()['tasks'][0]['importance'], '5')
+    
+    def test_endpoints_reject_non_string_titles(self):
+        """Test non-string titles get a 400 from every endpoint."""
+        tasks = [{'id': 1, 'title': 1}]
+        for url in ('/api/tasks/analyze/', '/api/tasks/suggest/', '/api/tasks/dependency-graph/'):
+            response = self.post_json(url, {'tasks': tasks})
+            self.assertEqual(response.status_code, 400)
+            self.assertEqual(response.json()['index'], 0)
+    
+    def test_endpoints_reject_unknown_strategies(self):
+        """Test strategies that aren't known strings get a 400 from the scoring endpoints."""
+        for url in ('/api/tasks/analyze/', '/api/tasks/suggest/'):
+            for strategy in ([1], {'name': 'smart_balance'}, 'bogus'):
+                response = self.post_json(url, {'tasks': self.tasks, 'strategy': strategy})
+                self.assertEqual(response.status_code, 400)
+                self.assertIn('strategy', response.json()['error'].lower())
+        
+        response = self.client.get('/api/tasks/suggest/', {'tasks': json.dumps(self.tasks), 'strategy': 'bogus'})
+        self.assertEqual(response.status_code, 400)
+    
+    def test_dependency_graph_reuses_cycle_check(self):
+        """Test the graph endpoint reuses cycle detection done for the same tasks."""
+        tasks = [
+            {'id': 1, 'title': 'Task 1', 'dependencies': [2]},
+            {'id': 2, 'title': 'Task 2', 'dependencies': [1]}
+        ]
+        self.post_json('/api/tasks/analyze/', {'tasks': tasks})
+        
+        with mock.patch('tasks.scoring._build_graph') as build_graph:
+            response = self.post_json('/api/tasks/dependency-graph/', {'tasks': tasks})
+            build_graph.assert_not_called()
+        data = response.json()
+        self.assertTrue(data['has_circular'])
+        self.assertEqual(sorted(data['graph']['circular_nodes']), [1, 2])
+        self.assertEqual(len(data['graph']['edges']), 2)
+    
+    def test_dependency_graph_caches_identical_requests(self):
+        """Test a repeated dependency-graph request is served from the response cache."""
+        first = self.post_json('/api/tasks/dependency-graph/', {'tasks': self.tasks})
+        
+        with mock.patch('tasks.views.build_dependency_graph') as build_graph:
+            second = self.post_json('/api/tasks/dependency-graph/', {'tasks': self.tasks})
+            build_graph.assert_not_called()
+        self.assertEqual(first.content, second.content)
+    
+    def test_non_object_body_rejected(self):
+        """Test endpoints reject JSON bodies that aren't objects with a 400."""
+        for url in ('/api/tasks/analyze/', '/api/tasks/suggest/', '/api/tasks/dependency-graph/', '/api/tasks/feedback/', '/api/tasks/'):
+            response = self.post_json(url, [1, 2, 3])
+            self.assertEqual(response.status_code, 400)
+            self.assertEqual(response.json()['error'], 'Request body must be a JSON object')
+    
+    def test_suggest_returns_top_three(self):
+        """Test suggest endpoint returns at most three suggestions."""
+        tasks = self.tasks + [{'id': i, 'title': f'Task {i}', 'importance': i} for i in range(3, 6)]
+        response = self.post_json('/api/tasks/suggest/', {'tasks': tasks})
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['count'], 3)
+    
+    def test_suggest_get(self):
+        """Test suggest endpoint reads tasks from the query string."""
+        response = self.client.get('/api/tasks/suggest/', {'tasks': json.dumps(self.tasks), 'strategy': 'deadline_driven'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['count'], 2)
+        
+        response = self.client.get('/api/tasks/suggest/', {'tasks': '[]'})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(self.client.get('/api/tasks/suggest/').status_code, 400)
+    
+    def test_suggest_caches_identical_requests(self):
+        """Test a repeated suggest request is served from the response cache."""
+        first = self.post_json('/api/tasks/suggest/', {'tasks': self.tasks})
+        
+        with mock.patch('tasks.views.get_top_tasks') as get_top:
+            second = self.post_json('/api/tasks/suggest/', {'tasks': self.tasks})
+            get_top.assert_not_called()
+        self.assertEqual(first.content, second.content)
+        
+        # A different body is scored afresh
+        third = self.post_json('/api/tasks/suggest/', {'tasks': self.tasks, 'strategy': 'fastest_wins'})
+        self.assertEqual(third.json()['strategy'], 'fastest_wins')
+
+
+class StaticAssetTests(TestCase):
+    """Test frontend assets are served at the site root."""
+    
+    def test_frontend_assets(self):
+        """Test styles and script are served by WhiteNoise."""
+        for path, content_type in (('/styles.css', 'text/css'), ('/script.js', 'text/javascript')):
+            response = self.client.get(path)
+            self.assertEqual(response.status_code, 200)
+            self.assertTrue(response['Content-Type'].startswith(content_type))
+            response.close()
+
+
+class TaskModelTests(TestCase):
+    """Test Task model serialization."""
+    
+    def setUp(self):
+        """Set up test data."""
+        self.base = Task.objects.create(title='Base task', importance=7)
+        self.other = Task.objects.create(title='Other task')
+        self.dependent = Task.objects.create(title='Dependent task', due_date=date(2025, 12, 1))
+        self.dependent.dependencies.set([self.base, self.other])
+    
+    def test_to_dict_fields(self):
+        """Test to_dict emits the fields expected by the scoring functions."""
+        data = self.dependent.to_dict()
+        
+        self.assertEqual(data['title'], 'Dependent task')
+        self.assertEqual(data['due_date'], '2025-12-01')
+        self.assertEqual(data['importance'], 5)
+        self.assertEqual(sorted(data['dependencies']), sorted([self.base.id, self.other.id]))
+    
+    def test_tasks_for_scoring_matches_to_dict(self):
+        """Test the values() loader returns the same dicts as to_dict (up to dependency order) in two queries."""
+        with self.assertNumQueries(2):
+            rows = tasks_for_scoring()
+        
+        expected = {task.id: task.to_dict() for task in Task.objects.all()}
+        self.assertEqual(len(rows), len(expected))
+        for row in rows:
+            row['dependencies'].sort()
+            expected[row['id']]['dependencies'].sort()
+            self.assertEqual(row, expected[row['id']])
+    
+    def test_task_list_view_queries(self):
+        """Test listing tasks takes a fixed number of queries."""
+        # ETag stamp, task rows, dependency links
+        with self.assertNumQueries(3):
+            response = self.client.get('/api/tasks/')
+        
+        data = response.json()
+        self.assertEqual(data['count'], 3)
+        listed = {task['id']: task for task in data['tasks']}
+        self.assertEqual(sorted(listed[self.dependent.id]['dependencies']), sorted([self.base.id, self.other.id]))
+    
+    def test_task_list_view_etag(self):
+        """Test an unchanged task list is answered with 304 Not Modified."""
+        etag = self.client.get('/api/tasks/')['ETag']
+        
+        with self.assertNumQueries(1):
+            response = self.client.get('/api/tasks/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        
+        Task.objects.create(title='Another task')
+        response = self.client.get('/api/tasks/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+    
+    def test_task_detail_view_etag(self):
+        """Test a task's ETag changes when its dependencies change."""
+        url = f'/api/tasks/{self.dependent.id}/'
+        etag = self.client.get(url)['ETag']
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+        
+        self.other.delete()
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+    
+    def test_task_create_view_links_dependencies(self):
+        """Test creating a task stores its dependencies once each."""
+        response = self.client.post(
+            '/api/tasks/',
+            json.dumps({'title': 'New task', 'dependencies': [self.base.id, self.other.id, self.base.id]}),
+            content_type='application/json'
+        )
+        
+        self.assertEqual(response.status_code, 201)
+        task = Task.objects.get(pk=response.json()['task']['id'])
+        self.assertEqual(sorted(task.dependencies.values_list('id', flat=True)), sorted([self.base.id, self.other.id]))
+        self.assertEqual(sorted(response.json()['task']['dependencies']), sorted([self.base.id, self.other.id]))
+    
+    def test_task_create_view_rolls_back_on_bad_dependency(self):
+        """Test a failed dependency link leaves no task behind."""
+        count = Task.objects.count()
+        with mock.patch.object(Task.dependencies.through.objects, 'bulk_create', side_effect=ValueError('boom')):
+            response = self.client.post(
+                '/api/tasks/',
+                json.dumps({'title': 'New task', 'due_date': '2025-12-01', 'dependencies': [self.base.id]}),
+                content_type='application/json'
+            )
+        
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(Task.objects.count(), count)
+    
+    def test_task_create_view_missing_title(self):
+        """Test creating a task without a title is a client error."""
+        response = self.client.post('/api/tasks/', json.dumps({'importance': 3}), content_type='application/json')
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('Error creating task', response.json()['error'])
+    
+    def test_task_create_view_due_date(self):
+        """Test a created task's due date is returned in ISO format."""
+        response = self.client.post(
+            '/api/tasks/',
+            json.dumps({'title': 'New task', 'due_date': '2025-12-01'}),
+            content_type='application/json'
+        )
+        
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.json()['task']['due_date'], '2025-12-01')
+    
+    def test_task_detail_view(self):
+        """Test fetching a single task returns its dependencies."""
+        with self.assertNumQueries(2):
+            response = self.client.get(f'/api/tasks/{self.dependent.id}/')
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(sorted(response.json()['task']['dependencies']), sorted([self.base.id, self.other.id]))
+        self.assertEqual(self.client.get('/api/tasks/999999/').status_code, 404)
+    
+    def test_task_delete_view(self):
+        """Test deleting a task removes it and its dependency links."""
+        response = self.client.delete(f'/api/tasks/{self.base.id}/')
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(Task.objects.filter(pk=self.base.id).exists())
+        self.assertEqual(list(self.dependent.dependencies.values_list('id', flat=True)), [self.other.id])
+        self.assertEqual(self.client.delete(f'/api/tasks/{self.base.id}/').status_code, 404)
+    
+    def test_to_dict_uses_prefetched_dependencies(self):
+        """Test to_dict doesn't query per task when dependencies are prefetched."""
+        with self.assertNumQueries(2):
+            tasks = list(Task.objects.prefetch_related('dependencies'))
+            for task in tasks:
+                task.to_dict()
+
+
+class DueDateRangeFilterTests(TestCase):
+    """Test the admin due date range filter."""
+    
+    def setUp(self):
+        """Set up test data."""
+        today = timezone.now().date()
+        self.overdue = Task.objects.create(title='Overdue', due_date=today - timedelta(days=2))
+        self.today = Task.objects.create(title='Today', due_date=today)
+        self.soon = Task.objects.create(title='Soon', due_date=today + timedelta(days=5))
+        self.later = Task.objects.create(title='Later', due_date=today + timedelta(days=20))
+        self.undated = Task.objects.create(title='Undated')
+    
+    def _filter(self, value):
+        request = RequestFactory().get('/', {'due': value})
+        model_admin = TaskAdmin(Task, AdminSite())
+        params = {'due': [value]}
+        list_filter = DueDateRangeFilter(request, params, Task, model_admin)
+        return set(list_filter.queryset(request, Task.objects.all()))
+    
+    def test_filter_options(self):
+        """Test each option selects the expected tasks."""
+        self.assertEqual(self._filter('overdue'), {self.overdue})
+        self.assertEqual(self._filter('today'), {self.today})
+        self.assertEqual(self._filter('week'), {self.today, self.soon})
+        self.assertEqual(self._filter('month'), {self.today, self.soon, self.later})
+        self.assertEqual(self._filter('none'), {self.undated})
+
+
+class FeedbackStatsTests(TestCase):
+    """Test feedback statistics used by the learning system."""
+    
+    def setUp(self):
+        """Drop cached stats left over from other tests' rolled-back data."""
+        cache.clear()
+    
+    def _record(self, was_helpful, priority_score, strategy='smart_balance'):
+        return record_feedback(
+            task_id=1,
+            task_title='Task',
+            strategy=strategy,
+            priority_score=priority_score,
+            was_helpful=was_helpful,
+            task_attributes={}
+        )
+    
+    def test_no_feedback(self):
+        """Test stats are zeroed when no feedback exists."""
+        stats = get_feedback_stats('smart_balance')
+        self.assertEqual(stats['total'], 0)
+        self.assertEqual(stats['helpful_rate'], 0.0)
+    
+    def test_stats_aggregation(self):
+        """Test stats are aggregated per strategy in a single query."""
+        self._record(True, 100.0)
+        self._record(True, 50.0)
+        self._record(False, 30.0)
+        self._record(False, 80.0, strategy='fastest_wins')
+        
+        with self.assertNumQueries(1):
+            stats = get_feedback_stats('smart_balance')
+        
+        self.assertEqual(stats['total'], 3)
+        self.assertEqual(stats['helpful_count'], 2)
+        self.assertEqual(stats['not_helpful_count'], 1)
+        self.assertAlmostEqual(stats['helpful_rate'], 2 / 3)
+        self.assertEqual(stats['avg_priority_score_helpful'], 75.0)
+        self.assertEqual(stats['avg_priority_score_not_helpful'], 30.0)
+    
+    def test_stats_cached_until_new_feedback(self):
+        """Test repeat stats lookups skip the database until feedback is recorded."""
+        self._record(True, 100.0)
+        self.assertEqual(get_feedback_stats('smart_balance')['total'], 1)
+        
+        with self.assertNumQueries(0):
+            get_feedback_stats('smart_balance')
+            get_adjusted_weights('smart_balance')
+            get_adjusted_weights('smart_balance')
+        
+        self._record(False, 20.0)
+        self.assertEqual(get_feedback_stats('smart_balance')['total'], 2)
+    
+    def test_record_feedback_bulk(self):
+        """Test bulk recording inserts in one query and invalidates cached stats."""
+        self.assertEqual(get_feedback_stats('smart_balance')['total'], 0)
+        entries = [
+            {'task_id': i, 'task_title': f'Task {i}', 'strategy': 'smart_balance',
+             'priority_score': 10.0 * i, 'was_helpful': i % 2 == 0, 'task_attributes': {}}
+            for i in range(4)
+        ]
+        
+        with self.assertNumQueries(1):
+            feedbacks = record_feedback_bulk(entries)
+        
+        self.assertEqual(len(feedbacks), 4)
+        stats = get_feedback_stats('smart_balance')
+        self.assertEqual(stats['total'], 4)
+        self.assertEqual(stats['helpful_count'], 2)
+    
+    def test_task_attributes_round_trip(self):
+        """Test task attributes are stored compactly by the orjson encoder."""
+        attributes = {'due_date': '2025-12-01', 'importance': 7, 'tags': ['a', 'b']}
+        self.assertEqual(json.dumps(attributes, cls=CompactJSONEncoder), '{"due_date":"2025-12-01","importance":7,"tags":["a","b"]}')
+        
+        feedback = record_feedback(
+            task_id=1,
+            task_title='Task',
+            strategy='smart_balance',
+            priority_score=10.0,
+            was_helpful=True,
+            task_attributes=attributes
+        )
+        self.assertEqual(TaskFeedback.objects.get(pk=feedback.pk).task_attributes, attributes)
+    
+    def test_task_attributes_reject_dates(self):
+        """Test date values are rejected as with the stdlib encoder."""
+        with self.assertRaises(TypeError):
+            json.dumps({'due_date': date(2025, 12, 1)}, cls=CompactJSONEncoder)
@@ -10,18 +10,275 @@ Endpoints:
 - DELETE /api/tasks/{id}/ - Delete a task
 """
 
-from django.http import JsonResponse, FileResponse, Http404
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.db import IntegrityError, transaction
+from django.db.models import Count, Max
+from django.http import HttpResponse, StreamingHttpResponse
+from django.utils.cache import get_conditional_response
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_http_methods
-from django.conf import settings
-from django.forms.models import model_to_dict
-import json
-import os
-from .scoring import analyze_tasks, get_top_tasks, detect_circular_dependencies, build_dependency_graph
-from .models import Task
+from datetime import date
+import hashlib
+import time
+import orjson
+from .scoring import ANALYSIS_CACHE_MAX_TASKS, STRATEGIES, analyze_tasks, analyze_dependencies, get_top_tasks, detect_circular_dependencies, build_dependency_graph, validate_tasks
+from .models import Task, tasks_for_scoring
 from .learning import record_feedback, get_feedback_stats, get_adjusted_weights
 
 
+def _json_response(data, status=200):
+    """
+    Encode a JSON response body with orjson instead of JsonResponse's stdlib encoder.
+    
+    Used by every endpoint; analyze, suggest and dependency-graph bodies carry
+    whole task lists, where encoding is a large share of the request.
+    """
+    return HttpResponse(orjson.dumps(data), status=status, content_type='application/json')
+
+
+def _parse_json(request):
+    """
+    Parse a request body that must be a JSON object.
+    
+    Only the decode is wrapped in try, so views can validate explicitly and
+    leave unexpected errors to Django's 500 handling.
+    
+    Returns:
+        (body, None) on success, or (None, error_response) with a 400 to return as-is
+    """
+    try:
+        body = orjson.loads(request.body)
+    except orjson.JSONDecodeError:
+        return None, _json_response({
+            'error': 'Invalid JSON in request body'
+        }, status=400)
+    if not isinstance(body, dict):
+        return None, _json_response({
+            'error': 'Request body must be a JSON object'
+        }, status=400)
+    return body, None
+
+
+def _task_list_etag() -> str:
+    """
+    Weak ETag for the task list from one aggregate query.
+    
+    Edits bump updated_at and creates/deletes change the count (deleting a task
+    also drops its dependency links), so the pair changes whenever the list does.
+    """
+    stamp = Task.objects.aggregate(latest=Max('updated_at'), count=Count('id'))
+    latest = stamp['latest'].timestamp() if stamp['latest'] else 0
+    return f'W/"{stamp["count"]}-{latest}"'
+
+
+def _content_etag(content: bytes) -> str:
+    """Weak ETag for an encoded response body."""
+    return f'W/"{hashlib.blake2b(content, digest_size=16).hexdigest()}"'
+
+
+def _find_duplicate_id(tasks):
+    """
+    Return (index, id) of the first task reusing an earlier task's id, or None.
+    
+    Tasks without an id are identified by position, as in the dependency graph,
+    so a positional id colliding with an explicit one counts as a duplicate.
+    """
+    seen = set()
+    for i, task in enumerate(tasks):
+        task_id = task.get('id', i)
+        if task_id in seen:
+            return i, task_id
+        seen.add(task_id)
+    return None
+
+
+def _invalid_strategy_response(strategy):
+    """Return a 400 unless strategy names a known scoring strategy, else None."""
+    if isinstance(strategy, str) and strategy in STRATEGIES:
+        return None
+    return _json_response({
+        'error': f'Unknown strategy: {strategy}. Expected one of: {", ".join(STRATEGIES)}'
+    }, status=400)
+
+
+def _invalid_tasks_response(tasks):
+    """
+    Validate a non-empty task list for the scoring and graph endpoints.
+    
+    Returns:
+        A 400 naming the index of the first invalid task or duplicate id, or None if the list is valid
+    """
+    errors = validate_tasks(tasks)
+    if errors:
+        index, error = errors[0]
+        return _json_response({
+            'error': f'Invalid task at index {index}: {error}',
+            'index': index
+        }, status=400)
+    
+    duplicate = _find_duplicate_id(tasks)
+    if duplicate:
+        index, task_id = duplicate
+        return _json_response({
+            'error': f'Duplicate task id at index {index}: {task_id}',
+            'index': index
+        }, status=400)
+    return None
+
+
+# Analyze results with at least this many tasks are streamed rather than encoded
+# in one piece; scoring doesn't cache rankings that size either
+STREAM_MIN_TASKS = ANALYSIS_CACHE_MAX_TASKS
+STREAM_CHUNK_TASKS = 500
+
+
+def _stream_json_list(key, items, rest):
+    """
+    Stream the JSON object {key: items, **rest} without building the whole body.
+    
+    Items are encoded STREAM_CHUNK_TASKS at a time, so only one chunk of
+    encoded bytes is resident and the first bytes go out before the last
+    task is encoded.
+    """
+    def chunks():
+        yield b'{' + orjson.dumps(key) + b':['
+        for start in range(0, len(items), STREAM_CHUNK_TASKS):
+            if start:
+                yield b','
+            # Encoding a slice and dropping its brackets yields comma-separated items
+            yield orjson.dumps(items[start:start + STREAM_CHUNK_TASKS])[1:-1]
+        yield b']' + (b',' + orjson.dumps(rest)[1:] if rest else b'}')
+    
+    return StreamingHttpResponse(chunks(), content_type='application/json')
+
+
+# Seconds to keep encoded responses of the pure scoring/graph endpoints.
+# /suggest/ is polled by the UI with the same task list, so a short TTL suffices.
+# Entries are shared by all worker processes only when REDIS_URL configures a
+# shared cache; the LocMemCache fallback keeps a separate copy per process.
+ANALYZE_CACHE_TIMEOUT = 300
+SUGGEST_CACHE_TIMEOUT = 60
+GRAPH_CACHE_TIMEOUT = 300
+
+
+def _response_cache_key(endpoint: str, request) -> str:
+    """
+    Build the response cache key for a scoring or graph endpoint request.
+    
+    Hashes the raw body (POST) or query string (GET), so repeat requests skip
+    parsing entirely. Scores depend on the current date, so it is part of the key.
+    """
+    payload = request.body if request.method == 'POST' else request.META.get('QUERY_STRING', '').encode()
+    digest = hashlib.blake2b(payload, digest_size=16).hexdigest()
+    return f"{endpoint}:{request.method}:{digest}:{date.today().isoformat()}"
+
+
+def _cached_response(cache_key):
+    """Return the cached encoded response for cache_key, or None on a miss."""
+    content = cache.get(cache_key)
+    if content is None:
+        return None
+    return HttpResponse(content, status=200, content_type='application/json')
+
+
+def _cache_json_response(cache_key, data, timeout):
+    """Encode a successful response once, caching the bytes before returning it."""
+    content = orjson.dumps(data)
+    cache.set(cache_key, content, timeout)
+    return HttpResponse(content, status=200, content_type='application/json')
+
+
+# Concurrent identical analyze requests wait up to SINGLEFLIGHT_WAIT seconds for the
+# first one's result; the lock expires on its own if that request dies mid-compute
+SINGLEFLIGHT_LOCK_TIMEOUT = 30
+SINGLEFLIGHT_WAIT = 1.0
+SINGLEFLIGHT_POLL_INTERVAL = 0.05
+
+
+def _singleflight(cache_key):
+    """
+    Deduplicate concurrent computations of the same cached response.
+    
+    The first caller takes a lock with cache.add (SET NX on Redis, so it holds
+    across workers) and computes. Later callers poll the response cache while the lock is held
+    and compute themselves if it is released without a result (errors aren't
+    cached) or the wait runs out.
+    
+    Returns:
+        (cached_response, owns_lock); cached_response is None unless another
+        request produced the result while we waited
+    """
+    lock_key = f"{cache_key}:lock"
+    if cache.add(lock_key, 1, SINGLEFLIGHT_LOCK_TIMEOUT):
+        return None, True
+    
+    deadline = time.monotonic() + SINGLEFLIGHT_WAIT
+    while time.monotonic() < deadline:
+        time.sleep(SINGLEFLIGHT_POLL_INTERVAL)
+        cached = _cached_response(cache_key)
+        if cached is not None:
+            return cached, False
+        if cache.get(lock_key) is None:
+            break
+    return None, False
+
+
+def _analyze_response(body, cache_key):
+    """Validate and score a parsed analyze request, caching successful responses under cache_key."""
+    tasks = body.get('tasks', [])
+    strategy = body.get('strategy', 'smart_balance')
+    consider_weekends = bool(body.get('consider_weekends', True))
+    
+    # Validate tasks is a list
+    if not isinstance(tasks, list):
+        return _json_response({
+            'error': 'Tasks must be a list'
+        }, status=400)
+    
+    invalid = _invalid_strategy_response(strategy)
+    if invalid:
+        return invalid
+    
+    # Nothing to analyze (health checks, initial page load)
+    if not tasks:
+        return _json_response({
+            'tasks': [],
+            'strategy': strategy,
+            'count': 0
+        }, status=200)
+    
+    # Reject malformed input before doing any graph or scoring work
+    invalid = _invalid_tasks_response(tasks)
+    if invalid:
+        return invalid
+    
+    # Check for circular dependencies and count dependents in one graph pass
+    dependencies = analyze_dependencies(tasks)
+    has_circular, cycle, _ = dependencies
+    warning = None
+    if has_circular:
+        warning = f"Warning: Circular dependency detected involving tasks: {cycle}"
+    
+    # Analyze tasks, reusing the graph pass above
+    analyzed_tasks = analyze_tasks(tasks, strategy, consider_weekends, precomputed=dependencies)
+    
+    summary = {
+        'strategy': strategy,
+        'count': len(analyzed_tasks)
+    }
+    
+    if warning:
+        summary['warning'] = warning
+    
+    # Bulk results are streamed instead of held (and cached) as one encoded body
+    if len(analyzed_tasks) >= STREAM_MIN_TASKS:
+        return _stream_json_list('tasks', analyzed_tasks, summary)
+    
+    return _cache_json_response(cache_key, {'tasks': analyzed_tasks, **summary}, ANALYZE_CACHE_TIMEOUT)
+
+
 @csrf_exempt
 @require_http_methods(["POST"])
 def analyze_tasks_view(request):
@@ -34,49 +291,35 @@ def analyze_tasks_view(request):
         "strategy": "smart_balance"  // optional
     }
     
-    Returns sorted tasks with priority scores.
+    Returns sorted tasks with priority scores, or a 400 for an unknown strategy
+    or naming the index of the first invalid task or duplicate id.
     """
-    try:
-        # Parse request body
-        body = json.loads(request.body)
-        tasks = body.get('tasks', [])
-        strategy = body.get('strategy', 'smart_balance')
-        consider_weekends = body.get('consider_weekends', True)
-        
-        # Validate tasks is a list
-        if not isinstance(tasks, list):
-            return JsonResponse({
-                'error': 'Tasks must be a list'
-            }, status=400)
-        
-        # Check for circular dependencies
-        has_circular, cycle = detect_circular_dependencies(tasks)
-        warning = None
-        if has_circular:
-            warning = f"Warning: Circular dependency detected involving tasks: {cycle}"
-        
-        # Analyze tasks
-        analyzed_tasks = analyze_tasks(tasks, strategy, consider_weekends)
-        
-        response_data = {
-            'tasks': analyzed_tasks,
-            'strategy': strategy,
-            'count': len(analyzed_tasks)
-        }
-        
-        if warning:
-            response_data['warning'] = warning
-        
-        return JsonResponse(response_data, status=200)
+    # Identical payloads are answered from the response cache
+    cache_key = _response_cache_key('analyze', request)
+    cached = _cached_response(cache_key)
+    if cached is not None:
+        return cached
     
-    except json.JSONDecodeError:
-        return JsonResponse({
-            'error': 'Invalid JSON in request body'
-        }, status=400)
-    except Exception as e:
-        return JsonResponse({
-            'error': f'Server error: {str(e)}'
-        }, status=500)
+    body, error = _parse_json(request)
+    if error:
+        return error
+    
+    # Let only one of several concurrent identical requests do the work. Bulk
+    # results are streamed and never cached, so waiters on them would only
+    # recompute after waiting, and they skip the lock.
+    tasks = body.get('tasks')
+    bulk = isinstance(tasks, list) and len(tasks) >= STREAM_MIN_TASKS
+    owns_lock = False
+    if settings.ANALYZE_SINGLEFLIGHT and not bulk:
+        cached, owns_lock = _singleflight(cache_key)
+        if cached is not None:
+            return cached
+    
+    try:
+        return _analyze_response(body, cache_key)
+    finally:
+        if owns_lock:
+            cache.delete(f"{cache_key}:lock")
 
 
 @csrf_exempt
@@ -93,51 +336,57 @@ def suggest_tasks_view(request):
     Note: In a real app, tasks would come from a database.
     For this demo, we accept tasks as a query parameter or JSON body.
     """
-    try:
-        # Get strategy
-        if request.method == 'POST':
-            try:
-                body = json.loads(request.body)
-                strategy = body.get('strategy', 'smart_balance')
-                tasks = body.get('tasks', [])
-            except json.JSONDecodeError:
-                return JsonResponse({
-                    'error': 'Invalid JSON in request body'
-                }, status=400)
-        else:
-            strategy = request.GET.get('strategy', 'smart_balance')
-            # Try to get tasks from query parameter (URL-encoded JSON)
-            tasks_json = request.GET.get('tasks', '[]')
-            try:
-                tasks = json.loads(tasks_json)
-            except json.JSONDecodeError:
-                tasks = []
-        
-        if not isinstance(tasks, list):
-            return JsonResponse({
-                'error': 'Tasks must be a list'
-            }, status=400)
-        
-        if not tasks:
-            return JsonResponse({
-                'error': 'No tasks provided. Please provide tasks in the request.',
-                'suggestions': []
-            }, status=400)
-        
-        # Get top 3 tasks
-        consider_weekends = body.get('consider_weekends', True) if request.method == 'POST' else True
-        top_tasks = get_top_tasks(tasks, strategy, top_n=3, consider_weekends=consider_weekends)
-        
-        return JsonResponse({
-            'suggestions': top_tasks,
-            'strategy': strategy,
-            'count': len(top_tasks)
-        }, status=200)
+    # Identical polls are answered from the response cache
+    cache_key = _response_cache_key('suggest', request)
+    cached = _cached_response(cache_key)
+    if cached is not None:
+        return cached
     
-    except Exception as e:
-        return JsonResponse({
-            'error': f'Server error: {str(e)}'
-        }, status=500)
+    # Get strategy; GET requests have no body options
+    body = {}
+    if request.method == 'POST':
+        body, error = _parse_json(request)
+        if error:
+            return error
+        strategy = body.get('strategy', 'smart_balance')
+        tasks = body.get('tasks', [])
+    else:
+        strategy = request.GET.get('strategy', 'smart_balance')
+        # Try to get tasks from query parameter (URL-encoded JSON); skip the parser when empty
+        tasks_json = request.GET.get('tasks', '')
+        try:
+            tasks = orjson.loads(tasks_json) if tasks_json and tasks_json != '[]' else []
+        except orjson.JSONDecodeError:
+            tasks = []
+    
+    if not isinstance(tasks, list):
+        return _json_response({
+            'error': 'Tasks must be a list'
+        }, status=400)
+    
+    invalid = _invalid_strategy_response(strategy)
+    if invalid:
+        return invalid
+    
+    if not tasks:
+        return _json_response({
+            'error': 'No tasks provided. Please provide tasks in the request.',
+            'suggestions': []
+        }, status=400)
+    
+    invalid = _invalid_tasks_response(tasks)
+    if invalid:
+        return invalid
+    
+    # Get top 3 tasks
+    consider_weekends = bool(body.get('consider_weekends', True))
+    top_tasks = get_top_tasks(tasks, strategy, top_n=3, consider_weekends=consider_weekends)
+    
+    return _cache_json_response(cache_key, {
+        'suggestions': top_tasks,
+        'strategy': strategy,
+        'count': len(top_tasks)
+    }, SUGGEST_CACHE_TIMEOUT)
 
 
 @csrf_exempt
@@ -157,43 +406,57 @@ def task_list_view(request):
     }
     """
     if request.method == 'GET':
-        tasks = Task.objects.all()
-        tasks_data = [task.to_dict() for task in tasks]
-        return JsonResponse({
+        # Unchanged lists are answered with a 304 after one aggregate query
+        etag = _task_list_etag()
+        not_modified = get_conditional_response(request, etag=etag)
+        if not_modified is not None:
+            return not_modified
+        
+        # Two queries (rows + dependency links) instead of one per task
+        tasks_data = tasks_for_scoring()
+        response = _json_response({
             'tasks': tasks_data,
             'count': len(tasks_data)
         }, status=200)
+        response['ETag'] = etag
+        return response
     
     elif request.method == 'POST':
-        try:
-            body = json.loads(request.body)
-            
-            # Create task
-            task = Task.objects.create(
-                title=body.get('title'),
-                due_date=body.get('due_date') if body.get('due_date') else None,
-                estimated_hours=body.get('estimated_hours') if body.get('estimated_hours') is not None else None,
-                importance=body.get('importance', 5)
-            )
-            
-            # Set dependencies if provided
-            dependencies = body.get('dependencies', [])
-            if dependencies:
-                task.dependencies.set(dependencies)
-            
-            return JsonResponse({
-                'task': task.to_dict(),
-                'message': 'Task created successfully'
-            }, status=201)
+        body, error = _parse_json(request)
+        if error:
+            return error
         
-        except json.JSONDecodeError:
-            return JsonResponse({
-                'error': 'Invalid JSON in request body'
-            }, status=400)
-        except Exception as e:
-            return JsonResponse({
+        try:
+            # Create the task and its links in one transaction: a single commit,
+            # and no task is left behind if a dependency can't be linked
+            with transaction.atomic():
+                task = Task.objects.create(
+                    title=body.get('title'),
+                    # Convert to a date up front so to_dict below can serialize it
+                    due_date=Task._meta.get_field('due_date').to_python(body.get('due_date') or None),
+                    estimated_hours=body.get('estimated_hours') if body.get('estimated_hours') is not None else None,
+                    importance=body.get('importance', 5)
+                )
+                
+                # Link dependencies if provided; the task is new, so a single
+                # INSERT replaces set()'s read-and-diff of existing links
+                dependencies = body.get('dependencies', [])
+                if dependencies:
+                    through = Task.dependencies.through
+                    through.objects.bulk_create([
+                        through(from_task_id=task.id, to_task_id=dep_id)
+                        for dep_id in dict.fromkeys(dependencies)
+                    ])
+        except (ValidationError, IntegrityError, ValueError, TypeError) as e:
+            # Bad field values or dependency ids that don't exist
+            return _json_response({
                 'error': f'Error creating task: {str(e)}'
             }, status=400)
+        
+        return _json_response({
+            'task': task.to_dict(),
+            'message': 'Task created successfully'
+        }, status=201)
 
 
 @csrf_exempt
@@ -203,23 +466,35 @@ def task_detail_view(request, task_id):
     GET /api/tasks/{id}/ - Get a specific task
     DELETE /api/tasks/{id}/ - Delete a task
     """
+    if request.method == 'DELETE':
+        # Delete straight from a queryset; the returned count doubles as the existence check
+        deleted, _ = Task.objects.filter(pk=task_id).delete()
+        if not deleted:
+            return _json_response({
+                'error': 'Task not found'
+            }, status=404)
+        return _json_response({
+            'message': 'Task deleted successfully'
+        }, status=200)
+    
+    # Read only the to_dict columns and load dependencies with the task
+    queryset = Task.objects.only('id', 'title', 'due_date', 'estimated_hours', 'importance').prefetch_related('dependencies')
     try:
-        task = Task.objects.get(pk=task_id)
+        task = queryset.get(pk=task_id)
     except Task.DoesNotExist:
-        return JsonResponse({
+        return _json_response({
             'error': 'Task not found'
         }, status=404)
     
-    if request.method == 'GET':
-        return JsonResponse({
-            'task': task.to_dict()
-        }, status=200)
-    
-    elif request.method == 'DELETE':
-        task.delete()
-        return JsonResponse({
-            'message': 'Task deleted successfully'
-        }, status=200)
+    # The body is tiny, so tag it by content; clients skip re-downloading it on a match
+    content = orjson.dumps({'task': task.to_dict()})
+    etag = _content_etag(content)
+    not_modified = get_conditional_response(request, etag=etag)
+    if not_modified is not None:
+        return not_modified
+    response = HttpResponse(content, status=200, content_type='application/json')
+    response['ETag'] = etag
+    return response
 
 
 @csrf_exempt
@@ -235,32 +510,41 @@ def dependency_graph_view(request):
         "tasks": [...]
     }
     """
-    try:
-        body = json.loads(request.body)
-        tasks = body.get('tasks', [])
-        
-        if not isinstance(tasks, list):
-            return JsonResponse({
-                'error': 'Tasks must be a list'
-            }, status=400)
-        
-        graph_data = build_dependency_graph(tasks)
-        has_circular, cycle = detect_circular_dependencies(tasks)
-        
-        return JsonResponse({
-            'graph': graph_data,
-            'has_circular': has_circular,
-            'cycle': cycle
-        }, status=200)
+    # Large graphs are built once per distinct payload, then served from the cache
+    cache_key = _response_cache_key('dependency-graph', request)
+    cached = _cached_response(cache_key)
+    if cached is not None:
+        return cached
     
-    except json.JSONDecodeError:
-        return JsonResponse({
-            'error': 'Invalid JSON in request body'
+    body, error = _parse_json(request)
+    if error:
+        return error
+    tasks = body.get('tasks', [])
+    
+    if not isinstance(tasks, list):
+        return _json_response({
+            'error': 'Tasks must be a list'
         }, status=400)
-    except Exception as e:
-        return JsonResponse({
-            'error': f'Server error: {str(e)}'
-        }, status=500)
+    
+    if not tasks:
+        return _json_response({
+            'graph': {'nodes': [], 'edges': [], 'circular_nodes': []},
+            'has_circular': False,
+            'cycle': []
+        }, status=200)
+    
+    invalid = _invalid_tasks_response(tasks)
+    if invalid:
+        return invalid
+    
+    graph_data = build_dependency_graph(tasks)
+    has_circular, cycle = detect_circular_dependencies(tasks)
+    
+    return _cache_json_response(cache_key, {
+        'graph': graph_data,
+        'has_circular': has_circular,
+        'cycle': cycle
+    }, GRAPH_CACHE_TIMEOUT)
 
 
 @csrf_exempt
@@ -282,22 +566,24 @@ def submit_feedback_view(request):
         "feedback_note": "Optional note"
     }
     """
+    body, error = _parse_json(request)
+    if error:
+        return error
+    
+    task_id = body.get('task_id')
+    task_title = body.get('task_title', '')
+    strategy = body.get('strategy', 'smart_balance')
+    priority_score = body.get('priority_score', 0.0)
+    was_helpful = body.get('was_helpful', False)
+    task_attributes = body.get('task_attributes', {})
+    feedback_note = body.get('feedback_note')
+    
+    if task_id is None:
+        return _json_response({
+            'error': 'task_id is required'
+        }, status=400)
+    
     try:
-        body = json.loads(request.body)
-        
-        task_id = body.get('task_id')
-        task_title = body.get('task_title', '')
-        strategy = body.get('strategy', 'smart_balance')
-        priority_score = body.get('priority_score', 0.0)
-        was_helpful = body.get('was_helpful', False)
-        task_attributes = body.get('task_attributes', {})
-        feedback_note = body.get('feedback_note')
-        
-        if task_id is None:
-            return JsonResponse({
-                'error': 'task_id is required'
-            }, status=400)
-        
         feedback = record_feedback(
             task_id=task_id,
             task_title=task_title,
@@ -307,24 +593,20 @@ def submit_feedback_view(request):
             task_attributes=task_attributes,
             feedback_note=feedback_note
         )
-        
-        # Get updated feedback stats
-        stats = get_feedback_stats(strategy)
-        
-        return JsonResponse({
-            'message': 'Feedback recorded successfully',
-            'feedback_id': feedback.id,
-            'stats': stats
-        }, status=201)
-    
-    except json.JSONDecodeError:
-        return JsonResponse({
-            'error': 'Invalid JSON in request body'
+    except (ValidationError, IntegrityError, ValueError, TypeError) as e:
+        # Field values the model can't store
+        return _json_response({
+            'error': f'Invalid feedback: {str(e)}'
         }, status=400)
-    except Exception as e:
-        return JsonResponse({
-            'error': f'Server error: {str(e)}'
-        }, status=500)
+    
+    # Get updated feedback stats
+    stats = get_feedback_stats(strategy)
+    
+    return _json_response({
+        'message': 'Feedback recorded successfully',
+        'feedback_id': feedback.id,
+        'stats': stats
+    }, status=201)
 
 
 @csrf_exempt
@@ -338,28 +620,11 @@ def feedback_stats_view(request):
     Query parameters:
     - strategy: Scoring strategy (default: 'smart_balance')
     """
-    try:
-        strategy = request.GET.get('strategy', 'smart_balance')
-        stats = get_feedback_stats(strategy)
-        
-        return JsonResponse({
-            'strategy': strategy,
-            'stats': stats
-        }, status=200)
+    strategy = request.GET.get('strategy', 'smart_balance')
+    stats = get_feedback_stats(strategy)
     
-    except Exception as e:
-        return JsonResponse({
-            'error': f'Server error: {str(e)}'
-        }, status=500)
+    return _json_response({
+        'strategy': strategy,
+        'stats': stats
+    }, status=200)
 
-
-def serve_static_file(request, filename):
-    """Serve static files from frontend directory in development."""
-    frontend_dir = settings.STATICFILES_DIRS[0] if settings.STATICFILES_DIRS else None
-    if not frontend_dir:
-        raise Http404("Static files directory not configured")
-    
-    file_path = os.path.join(frontend_dir, filename)
-    if os.path.exists(file_path):
-        return FileResponse(open(file_path, 'rb'), content_type='text/css' if filename.endswith('.css') else 'application/javascript')
-    raise Http404(f"File not found: {filename}")